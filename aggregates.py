@@ -0,0 +1,110 @@
+"""
+Materializované agregace fanoušků pro dashboard.
+Udržují se inkrementálně z write path úložiště (FanStorage.add_observer),
+takže dashboard je čte v O(1) bez ohledu na velikost databáze.
+"""
+
+import heapq
+import itertools
+import threading
+from collections import Counter
+from typing import Callable, Optional
+
+from storage import nickname_key
+
+
+class FanAggregates:
+    """Počty podle tier, součet podpory a top-K fanoušků (omezená min-halda)."""
+
+    def __init__(
+        self,
+        top_k: int = 5,
+        refill: Optional[Callable[[int], list[dict]]] = None,
+    ):
+        self.top_k = top_k
+        # Doplnění haldy po smazání člena top-K (např. FanStorage.top_fans)
+        self._refill = refill
+        self._lock = threading.Lock()
+        self._seq = itertools.count()
+        self._reset_state()
+
+    def _reset_state(self) -> None:
+        self.total = 0
+        self.tier_counts: Counter = Counter()
+        self.total_support = 0
+        # Min-halda (podpora, -pořadí, klíč, fan) – při shodě vyhrává starší
+        self._top: list[tuple] = []
+        self._top_keys: set[str] = set()
+
+    def _entry(self, fan: dict) -> tuple:
+        return (fan.get("total_support", 0), -next(self._seq), nickname_key(fan["nickname"]), fan)
+
+    def _push_top(self, fan: dict) -> None:
+        entry = self._entry(fan)
+        if len(self._top) < self.top_k:
+            heapq.heappush(self._top, entry)
+            self._top_keys.add(entry[2])
+        elif entry > self._top[0]:
+            evicted = heapq.heapreplace(self._top, entry)
+            self._top_keys.discard(evicted[2])
+            self._top_keys.add(entry[2])
+
+    def _drop_top(self, key: str) -> None:
+        self._top = [e for e in self._top if e[2] != key]
+        heapq.heapify(self._top)
+        self._top_keys.discard(key)
+
+    # --- rozhraní pozorovatele úložiště ---
+
+    def reset(self, fans: list[dict]) -> None:
+        with self._lock:
+            self._reset_state()
+            for fan in fans:
+                self.total += 1
+                self.tier_counts[fan.get("tier")] += 1
+                self.total_support += fan.get("total_support", 0)
+                self._push_top(fan)
+
+    def on_insert(self, fan: dict) -> None:
+        with self._lock:
+            self.total += 1
+            self.tier_counts[fan.get("tier")] += 1
+            self.total_support += fan.get("total_support", 0)
+            key = nickname_key(fan["nickname"])
+            if key in self._top_keys:
+                # Už je v haldě díky doplnění po předchozím smazání
+                self._drop_top(key)
+            self._push_top(fan)
+
+    def on_delete(self, fan: dict) -> None:
+        with self._lock:
+            self.total -= 1
+            self.tier_counts[fan.get("tier")] -= 1
+            self.total_support -= fan.get("total_support", 0)
+            key = nickname_key(fan["nickname"])
+            if key not in self._top_keys:
+                return
+            self._drop_top(key)
+            if self._refill is None:
+                return
+        # Doplnění čte z úložiště – mimo vlastní zámek, aby čtení, které
+        # agregace přebuduje (reset), nemohlo uváznout
+        candidates = self._refill(self.top_k)
+        with self._lock:
+            self._top = []
+            self._top_keys = set()
+            for candidate in candidates:
+                self._push_top(candidate)
+
+    # --- čtení ---
+
+    def snapshot(self) -> dict:
+        """Aktuální agregace: total, tier_counts, total_support, top (sestupně)."""
+        with self._lock:
+            top = sorted(self._top, reverse=True)
+            return {
+                "total": self.total,
+                "tier_counts": dict(self.tier_counts),
+                "total_support": self.total_support,
+                "top": [entry[3] for entry in top],
+            }
@@ -0,0 +1,507 @@
+"""
+Benchmarky horkých cest BaddieOS.
+Měří úložiště (load_db/save_db, insert), get_df, CRM řazení/filtr/hledání,
+agregace dashboardu, klasifikaci zpráv a generování ComfyUI workflow na
+syntetických fanoušcích (deterministický seed → opakovatelné výsledky)
+a studený start / rerun každé stránky proti rozpočtu.
+
+    python bench.py                               # 1k, 10k, 100k, 1M
+    python bench.py --sizes 1000,10000 --repeat 5
+    python bench.py --save-baseline               # uloží bench_baseline.json
+    python bench.py --baseline bench_baseline.json --fail-on-regression
+
+Výsledky jdou do bench_results.json; s --baseline se vypíše srovnání
+a regrese nad --threshold (výchozí 10 %).
+"""
+
+import argparse
+import gc
+import io
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from typing import Callable, Optional
+
+from aggregates import FanAggregates
+from search_index import NicknameIndex
+from storage import TIERS, JsonStorage, SqliteStorage
+
+DEFAULT_SIZES = [1_000, 10_000, 100_000, 1_000_000]
+RESULTS_FILE = "bench_results.json"
+BASELINE_FILE = "bench_baseline.json"
+
+SYLLABLES = ["ko", "pe", "šá", "ri", "mo", "da", "že", "lu", "tý", "na", "vo", "čí", "ba", "ká"]
+SEARCH_QUERIES = ["ko", "š", "sar", "pepa", "mod", "xyzq"]
+MESSAGES = [
+    "Ahoj krásko, jak se máš?",
+    "Kdy bude nové video? 🔥",
+    "Můžeme se někdy potkat osobně?",
+    "Posílám ti malý dárek na podporu",
+    "Jsi fakt úžasná, líbíš se mi",
+    "Co děláš o víkendu?",
+    "hej, ukáž nějakou novou fotku",
+    "Díky za včerejší stream",
+]
+
+
+# ============================================================================
+# SYNTETICKÁ DATA
+# ============================================================================
+
+def synthetic_fans(n: int, seed: int = 42) -> list[dict]:
+    """N deterministických fanoušků s unikátními nicknamy."""
+    rng = random.Random(seed)
+    start = datetime(2024, 1, 1)
+    fans = []
+    for i in range(n):
+        name = "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4))).capitalize()
+        fans.append({
+            "nickname": f"{name}{i}",
+            "tier": rng.choices(TIERS, weights=[80, 15, 5])[0],
+            "total_support": rng.choice([0, 0, 0, rng.randint(50, 500), rng.randint(1000, 20000)]),
+            "notes": rng.choice(["", "", "aktivní v komentářích", "poslal dárek", "VIP kandidát"]),
+            "migrate_telegram": rng.random() < 0.2,
+            "created": (start + timedelta(minutes=i)).isoformat(),
+        })
+    return fans
+
+
+def synthetic_messages(n: int, seed: int = 42) -> list[str]:
+    rng = random.Random(seed)
+    return [f"{rng.choice(MESSAGES)} #{rng.randint(0, n)}" for _ in range(n)]
+
+
+# ============================================================================
+# MĚŘENÍ
+# ============================================================================
+
+def measure(
+    func: Callable[[], object],
+    repeat: int,
+    setup: Optional[Callable[[], None]] = None,
+) -> list[float]:
+    """Časy jednotlivých běhů (s). GC je během měření vypnutý – jako v timeit."""
+    times = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            func()
+            times.append(time.perf_counter() - start)
+        finally:
+            gc.enable()
+    return times
+
+
+class Bench:
+    """Sběr výsledků: název → statistika časů."""
+
+    def __init__(self, repeat: int):
+        self.repeat = repeat
+        self.results: dict[str, dict] = {}
+
+    def run(
+        self,
+        name: str,
+        func: Callable[[], object],
+        ops: int = 1,
+        repeat: Optional[int] = None,
+        setup: Optional[Callable[[], None]] = None,
+    ) -> None:
+        self.record(name, measure(func, repeat or self.repeat, setup), ops)
+
+    def record(self, name: str, times: list[float], ops: int = 1) -> None:
+        """Uloží časy změřené jinde (např. v samostatném procesu)."""
+        best = min(times)
+        self.results[name] = {
+            "min": best,
+            "median": statistics.median(times),
+            "mean": statistics.fmean(times),
+            "runs": len(times),
+            "ops": ops,
+            "ops_per_sec": ops / best if best > 0 else None,
+        }
+        rate = f"{ops / best:,.0f} ops/s" if best > 0 else "—"
+        print(f"  {name:<40} {best * 1000:>10.2f} ms  ({rate})")
+
+
+# ============================================================================
+# SADY BENCHMARKŮ
+# ============================================================================
+
+def bench_storage(bench: Bench, fans: list[dict], workdir: str) -> None:
+    n = len(fans)
+    # Velké databáze se měří méně krát
+    repeat = 1 if n >= 1_000_000 else None
+    for backend, cls, filename in (
+        ("sqlite", SqliteStorage, "fans.sqlite3"),
+        ("json", JsonStorage, "fans.json"),
+    ):
+        path = os.path.join(workdir, filename)
+        storage = cls(path)
+        bench.run(f"{backend}.save_db[{n}]", lambda: storage.save_all(fans), ops=n, repeat=repeat)
+        storage.close()
+
+        def load():
+            s = cls(path)
+            s.load_all()
+            s.close()
+
+        bench.run(f"{backend}.load_db[{n}]", load, ops=n, repeat=repeat)
+
+        storage = cls(path)
+        extra = synthetic_fans(100, seed=n)
+        for fan in extra:
+            fan["nickname"] = f"bench-{fan['nickname']}"
+
+        def cleanup():
+            for fan in extra:
+                storage.delete_fan(fan["nickname"])
+
+        bench.run(
+            f"{backend}.insert_fan[{n}]",
+            lambda: [storage.insert_fan(fan) for fan in extra],
+            ops=len(extra),
+            setup=cleanup,
+        )
+        cleanup()
+        storage.close()
+
+
+def bench_crm(bench: Bench, fans: list[dict]) -> None:
+    from frames import fans_to_df
+
+    n = len(fans)
+    repeat = 1 if n >= 1_000_000 else None
+    bench.run(f"get_df[{n}]", lambda: fans_to_df(fans), ops=n, repeat=repeat)
+    df = fans_to_df(fans)
+    bench.run(
+        f"crm.sort_support[{n}]",
+        lambda: df.sort_values("total_support", ascending=False, kind="stable"),
+        ops=n,
+        repeat=repeat,
+    )
+
+    index = NicknameIndex()
+    bench.run(f"search.build_index[{n}]", lambda: index.reset(fans), ops=n, repeat=repeat)
+    bench.run(
+        f"search.query[{n}]",
+        lambda: [index.search(q) for q in SEARCH_QUERIES],
+        ops=len(SEARCH_QUERIES),
+    )
+
+    def crm_filter():
+        matches = index.search("ko")
+        filtered = df[df.index.isin(matches)]
+        return filtered[filtered["tier"].isin(["Supporter", "VIP"])]
+
+    bench.run(f"crm.filter[{n}]", crm_filter)
+
+    aggregates = FanAggregates(top_k=5)
+    bench.run(f"aggregates.reset[{n}]", lambda: aggregates.reset(fans), ops=n, repeat=repeat)
+    bench.run(
+        f"aggregates.snapshot[{n}]",
+        lambda: [aggregates.snapshot() for _ in range(1000)],
+        ops=1000,
+    )
+    new_fans = synthetic_fans(1000, seed=n + 1)
+    for fan in new_fans:
+        fan["nickname"] = f"agg-{fan['nickname']}"
+    bench.run(
+        f"aggregates.on_insert[{n}]",
+        lambda: [aggregates.on_insert(fan) for fan in new_fans],
+        ops=len(new_fans),
+        repeat=1,
+    )
+
+
+def bench_classify(bench: Bench) -> None:
+    import pandas as pd
+
+    from responses import CLASSIFIER, classify_message
+
+    messages = synthetic_messages(10_000)
+    bench.run(
+        "classify_message[10000]",
+        lambda: [classify_message(m) for m in messages],
+        ops=len(messages),
+    )
+    series = pd.Series(messages)
+    bench.run(
+        "classify_series[10000]",
+        lambda: CLASSIFIER.classify_series(series),
+        ops=len(messages),
+    )
+
+
+def bench_workflow(bench: Bench) -> None:
+    from comfyui_workflow import (
+        generate_comfyui_workflow,
+        get_template,
+        iter_sweep,
+        write_sweep_jsonl,
+        write_sweep_zip,
+    )
+
+    params = dict(
+        breed="golden retriever",
+        positive_prompt="a golden retriever dancing, studio lighting",
+        negative_prompt="blurry, deformed",
+        controlnet_strength=0.8,
+        ip_adapter_weight=0.7,
+        steps=25,
+        cfg=7.0,
+        seed=42,
+        width=512,
+        height=768,
+        frame_rate=12,
+        total_frames=48,
+    )
+
+    def generate():
+        for seed in range(100):
+            generate_comfyui_workflow(**{**params, "seed": seed})
+
+    def generate_and_dump():
+        for seed in range(100):
+            json.dumps(generate_comfyui_workflow(**{**params, "seed": seed}), indent=2)
+
+    template = get_template()
+
+    def render_seeds():
+        for seed in range(100):
+            template.render(seed=seed)
+
+    def render_seeds_compact():
+        for seed in range(100):
+            template.dumps(template.render(seed=seed), compact=True)
+
+    bench.run("workflow.generate[100]", generate, ops=100)
+    bench.run("workflow.generate_json[100]", generate_and_dump, ops=100)
+    bench.run("workflow.render_seed[100]", render_seeds, ops=100)
+    bench.run("workflow.render_seed_compact[100]", render_seeds_compact, ops=100)
+
+    axes = {"seed": list(range(1, 51)), "cfg": [6.0, 7.0], "controlnet_strength": [0.7, 0.8, 0.9, 1.0, 1.1]}
+    bench.run(
+        "workflow.sweep_zip[500]",
+        lambda: write_sweep_zip(iter_sweep({}, axes), io.BytesIO()),
+        ops=500,
+    )
+    bench.run(
+        "workflow.sweep_jsonl[500]",
+        lambda: write_sweep_jsonl(iter_sweep({}, axes), io.StringIO()),
+        ops=500,
+    )
+
+
+# Měření jedné stránky v čistém procesu: import app + modulu stránky
+# (bez samotného streamlitu), pak reruny stránky přes AppTest
+STARTUP_PROBE = """
+import json, os, sys, time
+root, label, module, reruns = sys.argv[1], sys.argv[2], sys.argv[3], int(sys.argv[4])
+sys.path.insert(0, root)
+import streamlit
+start = time.perf_counter()
+import app
+__import__(module)
+import_s = time.perf_counter() - start
+from streamlit.testing.v1 import AppTest
+at = AppTest.from_file(os.path.join(root, "app.py"), default_timeout=60)
+at.run()
+start = time.perf_counter()
+at.sidebar.radio[0].set_value(label).run()
+open_s = time.perf_counter() - start
+times = []
+for _ in range(reruns):
+    start = time.perf_counter()
+    at.run()
+    times.append(time.perf_counter() - start)
+print(json.dumps({
+    "import": import_s,
+    "open": open_s,
+    "reruns": times,
+    "errors": [str(e.value) for e in at.exception],
+    "modules": {m: m in sys.modules for m in ("pandas", "requests")},
+}))
+"""
+
+# Rozpočet studeného startu a rerunu – překročení se hlásí jako regrese
+IMPORT_BUDGET_MS = 150          # import app + modulu stránky (streamlit se nepočítá)
+IMPORT_BUDGET_PANDAS_MS = 500   # totéž pro stránky s pandas (CRM, Performance)
+RERUN_BUDGET_MS = 250    # jeden rerun stránky (AppTest, teplé cache)
+# Stránky, které nesmí při otevření načíst pandas
+PANDAS_FREE_PAGES = {
+    "📊 Dashboard",
+    "💬 Response Assistant",
+    "🔒 Safety Checklist",
+    "📡 Status Generator",
+    "🎬 ComfyUI Pipeline",
+}
+
+
+def bench_startup(bench: Bench, workdir: str) -> list[str]:
+    """Studený start a rerun každé stránky v samostatném procesu. Vrátí porušení rozpočtu."""
+    from app import PAGES
+
+    root = os.path.dirname(os.path.abspath(__file__))
+    violations = []
+    for label, (module, _) in PAGES.items():
+        samples = []
+        for _ in range(bench.repeat):
+            # Prázdná DB ve workdir – měří se kód stránky, ne data
+            out = subprocess.run(
+                [sys.executable, "-c", STARTUP_PROBE, root, label, module, "5"],
+                cwd=workdir, capture_output=True, text=True, check=True,
+            ).stdout
+            samples.append(json.loads(out.strip().splitlines()[-1]))
+        name = module.removeprefix("views.")
+        bench.record(f"startup.import[{name}]", [r["import"] for r in samples])
+        bench.record(f"startup.open[{name}]", [r["open"] for r in samples])
+        bench.record(f"startup.rerun[{name}]", [t for r in samples for t in r["reruns"]])
+
+        last = samples[-1]
+        loaded = [m for m, present in last["modules"].items() if present]
+        print(f"  {'':<40} načteno: {', '.join(loaded) or '—'}")
+        import_ms = min(r["import"] for r in samples) * 1000
+        rerun_ms = min(t for r in samples for t in r["reruns"]) * 1000
+        if last["errors"]:
+            violations.append(f"{name}: výjimka {last['errors'][0]}")
+        budget = IMPORT_BUDGET_MS if label in PANDAS_FREE_PAGES else IMPORT_BUDGET_PANDAS_MS
+        if import_ms > budget:
+            violations.append(f"{name}: import {import_ms:.0f} ms > {budget} ms")
+        if rerun_ms > RERUN_BUDGET_MS:
+            violations.append(f"{name}: rerun {rerun_ms:.0f} ms > {RERUN_BUDGET_MS} ms")
+        if label in PANDAS_FREE_PAGES and last["modules"]["pandas"]:
+            violations.append(f"{name}: načítá pandas")
+    return violations
+
+
+# ============================================================================
+# VÝSLEDKY A SROVNÁNÍ
+# ============================================================================
+
+def environment() -> dict:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "commit": commit,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+    }
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list[str]:
+    """Vypíše srovnání s baseline a vrátí názvy benchmarků, které zpomalily."""
+    regressions = []
+    print(f"\n{'benchmark':<40} {'baseline':>12} {'teď':>12} {'změna':>9}")
+    for name, current in results.items():
+        base = baseline.get(name)
+        if base is None:
+            print(f"{name:<40} {'—':>12} {current['min'] * 1000:>10.2f}ms {'nový':>9}")
+            continue
+        # Srovnává se čas na operaci – funguje i po změně počtu operací v benchmarku
+        per_op, base_per_op = current["min"] / current["ops"], base["min"] / base["ops"]
+        ratio = per_op / base_per_op if base_per_op > 0 else 1.0
+        flag = ""
+        if ratio > 1 + threshold:
+            flag = " ⚠️"
+            regressions.append(name)
+        elif ratio < 1 - threshold:
+            flag = " ✅"
+        print(
+            f"{name:<40} {base['min'] * 1000:>10.2f}ms {current['min'] * 1000:>10.2f}ms "
+            f"{(ratio - 1) * 100:>+8.1f}%{flag}"
+        )
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmarky BaddieOS")
+    parser.add_argument(
+        "--sizes",
+        default=",".join(str(s) for s in DEFAULT_SIZES),
+        help="Velikosti databáze oddělené čárkou",
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="Počet opakování měření")
+    parser.add_argument(
+        "--only",
+        default="storage,crm,classify,workflow,startup",
+        help="Sady benchmarků (storage, crm, classify, workflow, startup)",
+    )
+    parser.add_argument("--output", default=RESULTS_FILE, help="Soubor s výsledky (JSON)")
+    parser.add_argument("--baseline", help="Baseline pro srovnání (JSON z dřívějšího běhu)")
+    parser.add_argument("--save-baseline", action="store_true", help=f"Uložit výsledky i jako {BASELINE_FILE}")
+    parser.add_argument("--threshold", type=float, default=0.10, help="Tolerance regrese (0.10 = 10 %%)")
+    parser.add_argument("--fail-on-regression", action="store_true", help="Exit code 1 při regresi")
+    args = parser.parse_args()
+
+    sizes = [int(s) for s in args.sizes.split(",") if s.strip()]
+    suites = {s.strip() for s in args.only.split(",")}
+    bench = Bench(args.repeat)
+    violations = []
+
+    workdir = tempfile.mkdtemp(prefix="baddieos-bench-")
+    try:
+        for n in sizes:
+            if not suites & {"storage", "crm"}:
+                break
+            print(f"\n📦 {n:,} fanoušků")
+            fans = synthetic_fans(n)
+            if "storage" in suites:
+                bench_storage(bench, fans, workdir)
+            if "crm" in suites:
+                bench_crm(bench, fans)
+            del fans
+            gc.collect()
+        if "classify" in suites:
+            print("\n🏷️ Klasifikace")
+            bench_classify(bench)
+        if "workflow" in suites:
+            print("\n🎬 ComfyUI workflow")
+            bench_workflow(bench)
+        if "startup" in suites:
+            print("\n🚀 Studený start a rerun stránek")
+            violations = bench_startup(bench, workdir)
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    report = {"environment": environment(), "results": bench.results}
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+    print(f"\n✅ Výsledky uloženy do {args.output}")
+    if args.save_baseline:
+        shutil.copyfile(args.output, BASELINE_FILE)
+        print(f"✅ Baseline uložena do {BASELINE_FILE}")
+
+    regressions = []
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)["results"]
+        regressions = compare(bench.results, baseline, args.threshold)
+        if regressions:
+            print(f"\n⚠️ Regrese ({len(regressions)}): {', '.join(regressions)}")
+    for violation in violations:
+        print(f"⚠️ Rozpočet startu: {violation}")
+    if (regressions or violations) and args.fail_on_regression:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
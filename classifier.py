@@ -0,0 +1,66 @@
+"""
+Klasifikátor zpráv podle klíčových slov.
+Automat se sestaví jednou z KEYWORD_MAP: každá kategorie je jeden
+předkompilovaný regex (alternace jejích klíčových slov), takže hledání
+probíhá v C enginu `re` místo smyčky přes jednotlivá slova v Pythonu.
+
+Priorita zůstává stejná jako dřív: vyhrává první kategorie v pořadí
+KEYWORD_MAP, ve které se najde jakékoliv klíčové slovo.
+
+Pro velké dávky (celý exportovaný inbox) je tu classify_series – vektorová
+varianta nad pandas Series; s Arrow řetězci (pandas + pyarrow) běží regexy
+nad celým sloupcem najednou v C++.
+"""
+
+import re
+from typing import Iterable
+
+
+class KeywordClassifier:
+    """Předkompilovaný klasifikátor nad mapou kategorie → klíčová slova."""
+
+    def __init__(self, keyword_map: dict[str, list[str]], fallback: str = "fallback"):
+        self.fallback = fallback
+        self._patterns = [
+            (category, self._compile(keywords))
+            for category, keywords in keyword_map.items()
+            if keywords
+        ]
+
+    @staticmethod
+    def _compile(keywords: list[str]) -> re.Pattern:
+        # Delší slova první – engine pak nezkouší zbytečně kratší prefixy
+        ordered = sorted({k.lower() for k in keywords}, key=len, reverse=True)
+        return re.compile("|".join(re.escape(k) for k in ordered))
+
+    def classify(self, msg: str) -> str:
+        """Vrátí kategorii zprávy (nebo fallback)."""
+        text = msg.lower()
+        for category, pattern in self._patterns:
+            if pattern.search(text):
+                return category
+        return self.fallback
+
+    def classify_many(self, messages: Iterable[str]) -> list[str]:
+        """Klasifikuje dávku zpráv; opakované zprávy se vyhodnotí jen jednou."""
+        seen: dict[str, str] = {}
+        result = []
+        for msg in messages:
+            category = seen.get(msg)
+            if category is None:
+                category = seen[msg] = self.classify(msg)
+            result.append(category)
+        return result
+
+    def classify_series(self, messages):
+        """Vektorová klasifikace pandas Series zpráv. Vrátí Series kategorií."""
+        import numpy as np
+        import pandas as pd
+
+        text = messages.fillna("").astype(str).str.lower()
+        labels = np.full(len(text), self.fallback, dtype=object)
+        # Od nejnižší priority k nejvyšší – vyšší priorita přepíše nižší
+        for category, pattern in reversed(self._patterns):
+            mask = text.str.contains(pattern.pattern, regex=True).to_numpy(dtype=bool)
+            labels[mask] = category
+        return pd.Series(labels, index=messages.index, name="category")
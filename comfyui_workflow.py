@@ -0,0 +1,302 @@
+"""
+Generátor ComfyUI API workflow pro tančícího psa
+(DWPose → ControlNet + IP-Adapter → AnimateDiff → video).
+
+Jediným zdrojem grafu je šablona comfyui_dog_dance_template.json – čistá
+šablona ke stažení i každé vygenerované workflow z ní vychází.
+WorkflowTemplate ji načte jednou, zapamatuje si sloty parametrů
+(uzel → vstup) a varianty vyrábí přepsáním jen těchto slotů.
+
+Sweep pro render farmu (varianty se zapisují průběžně, v paměti je vždy jen jedna):
+
+    python comfyui_workflow.py sweep.zip --seed 1:100 --cfg 6,7,8
+    python comfyui_workflow.py sweep.jsonl --controlnet-strength 0.6:0.9:0.05
+"""
+
+import argparse
+import itertools
+import json
+import math
+import os
+import zipfile
+from functools import lru_cache
+from typing import BinaryIO, Callable, Dict, Iterable, Iterator, Optional, TextIO, Tuple
+
+# Čistá šablona s výchozími hodnotami (ke stažení na stránce ComfyUI Pipeline)
+TEMPLATE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "comfyui_dog_dance_template.json")
+
+# Sloty parametrů: parametr → (uzel, vstup) – jeden parametr může plnit víc vstupů
+DOG_DANCE_SLOTS = {
+    "positive_prompt": (("6", "text"),),
+    "negative_prompt": (("7", "text"),),
+    "controlnet_strength": (("5", "strength"),),
+    "ip_adapter_weight": (("10", "weight"),),
+    "steps": (("12", "steps"),),
+    "cfg": (("12", "cfg"),),
+    "seed": (("12", "seed"),),
+    "width": (("3", "resolution"), ("13", "width")),
+    "height": (("13", "height"),),
+    "frame_rate": (("2", "force_rate"), ("17", "frame_rate")),
+    "total_frames": (("2", "frame_load_cap"), ("13", "batch_size")),
+    "filename_prefix": (("17", "filename_prefix"),),
+}
+
+# Titulky uzlů, které ukazují hodnotu parametru
+DOG_DANCE_TITLES = {
+    "5": "Aplikovat ControlNet (síla: {controlnet_strength})",
+    "10": "IP-Adapter Plus (váha: {ip_adapter_weight})",
+}
+
+
+# ============================================================================
+# ŠABLONA WORKFLOW
+# ============================================================================
+
+class WorkflowTemplate:
+    """
+    Předkompilovaná šablona ComfyUI workflow.
+
+    Při vytvoření si pro každý uzel spočítá, které parametry ho mění;
+    render() pak kopíruje jen tyto uzly a ostatní sdílí se šablonou.
+    Vrácené workflow proto ber jako read-only (na úpravy použij copy.deepcopy).
+    """
+
+    def __init__(self, graph: dict, slots: Dict[str, Tuple[Tuple[str, str], ...]],
+                 titles: Optional[Dict[str, str]] = None):
+        self.graph = graph
+        self.slots = slots
+        self.titles = titles or {}
+
+        # Uzel → parametry, které ho mění (vstupy i titulek)
+        self._node_params: Dict[str, set] = {}
+        for name, paths in slots.items():
+            for node_id, key in paths:
+                if key not in graph[node_id]["inputs"]:
+                    raise KeyError(f"Uzel {node_id} nemá vstup '{key}' (slot '{name}')")
+                self._node_params.setdefault(node_id, set()).add(name)
+        for node_id, fmt in self.titles.items():
+            for name in slots:
+                if "{" + name + "}" in fmt:
+                    self._node_params.setdefault(node_id, set()).add(name)
+
+        # Výchozí hodnoty = hodnoty prvního vstupu každého slotu v šabloně
+        self.defaults = {name: graph[paths[0][0]]["inputs"][paths[0][1]] for name, paths in slots.items()}
+        self._touched_cache: Dict[frozenset, list] = {}
+
+    @classmethod
+    def load(cls, path: str, slots: Dict[str, Tuple[Tuple[str, str], ...]],
+             titles: Optional[Dict[str, str]] = None) -> "WorkflowTemplate":
+        """Načte graf workflow ze souboru (API formát ComfyUI)."""
+        with open(path, "r", encoding="utf-8") as f:
+            return cls(json.load(f), slots, titles)
+
+    def render(self, **params) -> dict:
+        """Vrátí variantu workflow – přepíše jen sloty předaných parametrů."""
+        unknown = params.keys() - self.slots.keys()
+        if unknown:
+            raise TypeError(f"Neznámé parametry workflow: {', '.join(sorted(unknown))}")
+
+        workflow = dict(self.graph)
+        values = None
+        for node_id, title in self._touched(frozenset(params)):
+            node = workflow[node_id] = dict(self.graph[node_id])
+            node["inputs"] = dict(node["inputs"])
+            if title is not None:
+                values = values or {**self.defaults, **params}
+                node["_meta"] = {**node["_meta"], "title": title.format(**values)}
+
+        for name, value in params.items():
+            for node_id, key in self.slots[name]:
+                workflow[node_id]["inputs"][key] = value
+        return workflow
+
+    def _touched(self, names: frozenset) -> list:
+        """Uzly, které daná sada parametrů mění (s formátem titulku) – v cache podle sady."""
+        touched = self._touched_cache.get(names)
+        if touched is None:
+            touched = [
+                (node_id, self.titles.get(node_id))
+                for node_id, node_params in self._node_params.items()
+                if not node_params.isdisjoint(names)
+            ]
+            self._touched_cache[names] = touched
+        return touched
+
+    def derive(self, **params) -> "WorkflowTemplate":
+        """Nová šablona s jinými výchozími hodnotami (např. základ sweepu)."""
+        return WorkflowTemplate(self.render(**params), self.slots, self.titles)
+
+    def dumps(self, workflow: Optional[dict] = None, compact: bool = False) -> str:
+        """Serializuje workflow (výchozí = šablona); compact = bez odsazení a mezer."""
+        workflow = self.graph if workflow is None else workflow
+        if compact:
+            return json.dumps(workflow, ensure_ascii=False, separators=(",", ":"))
+        return json.dumps(workflow, ensure_ascii=False, indent=2)
+
+
+@lru_cache(maxsize=None)
+def get_template() -> WorkflowTemplate:
+    """Šablona tančícího psa – ze souboru se načte jen jednou za proces."""
+    return WorkflowTemplate.load(TEMPLATE_FILE, DOG_DANCE_SLOTS, DOG_DANCE_TITLES)
+
+
+def filename_prefix(breed: str) -> str:
+    """Prefix výstupního videa podle plemene."""
+    return f"dog_dance_{breed.replace(' ', '_')}"
+
+
+def generate_comfyui_workflow(
+    breed: str,
+    positive_prompt: str,
+    negative_prompt: str,
+    controlnet_strength: float,
+    ip_adapter_weight: float,
+    steps: int,
+    cfg: float,
+    seed: int,
+    width: int,
+    height: int,
+    frame_rate: int,
+    total_frames: int,
+) -> dict:
+    """
+    Generuje ComfyUI API workflow JSON pro tancujícího psa.
+    Pipeline: DWPose ControlNet → IP-Adapter Plus → AnimateDiff → Tile Upscale.
+    """
+    return get_template().render(
+        positive_prompt=positive_prompt,
+        negative_prompt=negative_prompt,
+        controlnet_strength=controlnet_strength,
+        ip_adapter_weight=ip_adapter_weight,
+        steps=steps,
+        cfg=cfg,
+        seed=seed,
+        width=width,
+        height=height,
+        frame_rate=frame_rate,
+        total_frames=total_frames,
+        filename_prefix=filename_prefix(breed),
+    )
+
+
+# ============================================================================
+# SWEEP – VÍCE VARIANT NAJEDNOU
+# ============================================================================
+
+# Parametry, které lze rozmítat, a jejich typ
+SWEEP_PARAMS: Dict[str, Callable] = {
+    "seed": int,
+    "controlnet_strength": float,
+    "ip_adapter_weight": float,
+    "steps": int,
+    "cfg": float,
+}
+# Pojistka proti omylem obřímu kartézskému součinu
+MAX_SWEEP_VARIANTS = 1000
+
+
+def parse_sweep_values(text: str, cast: Callable = float, limit: int = MAX_SWEEP_VARIANTS) -> Optional[list]:
+    """
+    Hodnoty jedné osy sweepu: "1, 2, 5" = seznam, "0.6:0.9:0.1" = rozsah
+    včetně konce (krok výchozí 1). Vrátí None, když text nejde přečíst
+    nebo má osa víc než `limit` hodnot – u rozsahu se to pozná dřív, než
+    se seznam sestaví (jinak by "1:2147483647" zahltil paměť).
+    """
+    text = text.strip()
+    try:
+        if ":" not in text:
+            values = [cast(v) for v in text.split(",") if v.strip()]
+            if len(values) > limit:
+                return None
+        else:
+            parts = [float(v) for v in text.split(":")]
+            if len(parts) == 2:
+                parts.append(1.0)
+            start, stop, step = parts
+            if step <= 0 or stop < start:
+                return None
+            count = math.floor((stop - start) / step + 1e-9) + 1
+            if count > limit:
+                return None
+            values = [cast(round(start + i * step, 6)) for i in range(count)]
+    except (ValueError, OverflowError):
+        # OverflowError: rozsah s nekonečným počtem kroků ("0:1e308:1e-308")
+        return None
+    # Pořadí zachováno, duplicity pryč
+    return list(dict.fromkeys(values)) or None
+
+
+def sweep_size(axes: Dict[str, list]) -> int:
+    """Počet variant sweepu (součin délek os)."""
+    return math.prod(len(values) for values in axes.values())
+
+
+def iter_sweep(base: dict, axes: Dict[str, list],
+               template: Optional[WorkflowTemplate] = None) -> Iterator[Tuple[int, dict, dict]]:
+    """
+    Líně generuje varianty (index, parametry, workflow) pro kartézský součin os.
+    Základ se vyrenderuje jednou, každá varianta pak přepisuje jen osy sweepu
+    a vlastní filename_prefix, aby se výstupy na farmě nepřepisovaly.
+    """
+    template = (template or get_template()).derive(**base)
+    prefix = template.defaults["filename_prefix"]
+    names = list(axes)
+    for index, combo in enumerate(itertools.product(*axes.values()), start=1):
+        params = dict(zip(names, combo))
+        workflow = template.render(**params, filename_prefix=f"{prefix}_{index:04d}")
+        yield index, params, workflow
+
+
+def write_sweep_jsonl(variants: Iterable[Tuple[int, dict, dict]], f: TextIO) -> int:
+    """Zapíše varianty jako JSON Lines (index, params, workflow na řádek). Vrátí počet."""
+    count = 0
+    for index, params, workflow in variants:
+        f.write(json.dumps({"index": index, "params": params, "workflow": workflow},
+                           ensure_ascii=False, separators=(",", ":")) + "\n")
+        count += 1
+    return count
+
+
+def write_sweep_zip(variants: Iterable[Tuple[int, dict, dict]], f: BinaryIO, compact: bool = True) -> int:
+    """Zapíše varianty do ZIP – jeden workflow JSON na soubor. Vrátí počet."""
+    count = 0
+    with zipfile.ZipFile(f, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        for index, params, workflow in variants:
+            name = f"{workflow['17']['inputs']['filename_prefix']}.json"
+            archive.writestr(name, get_template().dumps(workflow, compact=compact))
+            count += 1
+    return count
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Sweep ComfyUI workflow tančícího psa pro render farmu")
+    parser.add_argument("path", help="Výstup (.zip nebo .jsonl)")
+    parser.add_argument("--breed", default="golden retriever", help="Plemeno psa (prefix výstupů)")
+    for name in SWEEP_PARAMS:
+        parser.add_argument("--" + name.replace("_", "-"), help="Seznam (1,2,3) nebo rozsah (start:stop[:krok])")
+    args = parser.parse_args()
+
+    axes = {}
+    for name, cast in SWEEP_PARAMS.items():
+        text = getattr(args, name)
+        if text is None:
+            continue
+        # Osa smí mít jen tolik hodnot, kolik zbývá z limitu po předchozích osách
+        values = parse_sweep_values(text, cast, MAX_SWEEP_VARIANTS // sweep_size(axes))
+        if values is None:
+            parser.error(f"Neplatné hodnoty pro --{name.replace('_', '-')} nebo sweep "
+                         f"nad {MAX_SWEEP_VARIANTS} variant: {text}")
+        axes[name] = values
+
+    variants = iter_sweep({"filename_prefix": filename_prefix(args.breed)}, axes)
+    if args.path.lower().endswith((".jsonl", ".ndjson")):
+        with open(args.path, "w", encoding="utf-8") as f:
+            count = write_sweep_jsonl(variants, f)
+    else:
+        with open(args.path, "wb") as f:
+            count = write_sweep_zip(variants, f)
+    print(f"✅ Zapsáno {count} variant workflow do {args.path}")
+
+
+if __name__ == "__main__":
+    main()
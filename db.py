@@ -0,0 +1,84 @@
+"""
+Databázová vrstva BaddieOS – sdílené úložiště fanoušků, agregace pro
+dashboard a vyhledávací index. Bez pandas (DataFrame je ve frames.py),
+takže ji stránky bez tabulek načtou levně.
+"""
+
+import io
+import os
+from typing import Optional
+
+import streamlit as st
+
+import perf
+from aggregates import FanAggregates
+from fan_io import write_csv
+from search_index import NicknameIndex
+from storage import FanStorage, open_storage
+
+
+DB_FILE = "fans_db.json"
+SQLITE_FILE = "fans_db.sqlite3"
+# "sqlite" (výchozí) nebo "json" – původní formát jako fallback
+DB_BACKEND = os.environ.get("BADDIEOS_DB_BACKEND", "sqlite")
+
+
+@st.cache_resource
+def get_storage() -> FanStorage:
+    """Sdílená instance úložiště pro celý proces (všechny sessions)."""
+    return open_storage(DB_BACKEND, json_path=DB_FILE, sqlite_path=SQLITE_FILE)
+
+
+@perf.timed("db.load")
+def load_db() -> list:
+    """Načte databázi fanoušků."""
+    return get_storage().load_all()
+
+
+def save_db(data: list) -> None:
+    """Uloží celou databázi fanoušků."""
+    get_storage().save_all(data)
+
+
+@st.cache_resource(max_entries=1, show_spinner=False)
+def _build_csv_export(version: tuple) -> bytes:
+    """CSV export databáze (streamuje se po dávkách z úložiště)."""
+    buffer = io.StringIO()
+    write_csv(get_storage().iter_fans(), buffer)
+    return buffer.getvalue().encode("utf-8")
+
+
+def export_csv() -> bytes:
+    """Vrátí CSV export aktuální verze databáze."""
+    return _build_csv_export(get_storage().version())
+
+
+@st.cache_resource
+def get_aggregates() -> FanAggregates:
+    """Agregace pro dashboard udržované inkrementálně při zápisu do úložiště."""
+    storage = get_storage()
+    aggregates = FanAggregates(top_k=5, refill=storage.top_fans)
+    storage.add_observer(aggregates)
+    return aggregates
+
+
+@st.cache_resource
+def get_nickname_index() -> NicknameIndex:
+    """Vyhledávací index nicknamů udržovaný při zápisu do úložiště."""
+    index = NicknameIndex()
+    get_storage().add_observer(index)
+    return index
+
+
+def search_fans(query: str) -> Optional[set]:
+    """Klíče fanoušků odpovídajících hledání (None = nefiltrovat)."""
+    index = get_nickname_index()
+    get_storage().sync_observers()
+    return index.search(query)
+
+
+def get_stats() -> dict:
+    """Vrátí agregace pro dashboard v O(1)."""
+    aggregates = get_aggregates()
+    get_storage().sync_observers()
+    return aggregates.snapshot()
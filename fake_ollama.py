@@ -0,0 +1,237 @@
+"""
+Lokální náhrada Ollama serveru pro testy a zátěžové měření bez modelu.
+Implementuje /api/tags, /api/generate a /api/chat (streamované i ne)
+s nastavitelnou latencí, rychlostí tokenů a vkládáním chyb.
+
+    python fake_ollama.py --port 11435 --latency 0.2 --token-rate 40 --fail-rate 0.05
+
+V kódu:
+
+    with FakeOllama(FakeConfig(latency=0.1)) as url:
+        client = OllamaClient(base_url=url)
+"""
+
+import argparse
+import json
+import random
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+
+WORDS = [
+    "ahoj", "zlato", "dneska", "mám", "skvělou", "náladu", "🔥", "a", "co", "ty",
+    "těším", "se", "na", "večer", "💋", "díky", "moc", "jsi", "milej", "✨",
+]
+
+
+@dataclass
+class FakeConfig:
+    """Chování falešného serveru."""
+    latency: float = 0.1          # čekání před prvním tokenem (s)
+    token_rate: float = 50.0      # tokenů za sekundu
+    tokens: int = 30              # délka odpovědi v tokenech (omezí i num_predict)
+    fail_rate: float = 0.0        # pravděpodobnost HTTP 500
+    drop_rate: float = 0.0        # pravděpodobnost utrženého spojení (uprostřed streamu)
+    models: list[str] = field(default_factory=lambda: ["llama3.2"])
+    seed: Optional[int] = None
+
+
+class FakeOllamaHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"   # keep-alive jako skutečná Ollama
+    disable_nagle_algorithm = True  # TCP_NODELAY – malé NDJSON kousky hned na drát
+    server: "FakeOllamaServer"
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send_json(self, status: int, data: dict) -> None:
+        body = json.dumps(data, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_chunk(self, data: dict) -> None:
+        line = (json.dumps(data, ensure_ascii=False) + "\n").encode("utf-8")
+        self.wfile.write(b"%x\r\n%s\r\n" % (len(line), line))
+        self.wfile.flush()
+
+    def _drop(self) -> None:
+        self.close_connection = True
+        self.connection.close()
+
+    def do_GET(self):
+        if self.path != "/api/tags":
+            self._send_json(404, {"error": "not found"})
+            return
+        models = [{"name": name, "model": name} for name in self.server.config.models]
+        self._send_json(200, {"models": models})
+
+    def do_POST(self):
+        if self.path not in ("/api/generate", "/api/chat"):
+            self._send_json(404, {"error": "not found"})
+            return
+        length = int(self.headers.get("Content-Length", 0))
+        try:
+            request = json.loads(self.rfile.read(length) or b"{}")
+        except ValueError:
+            self._send_json(400, {"error": "invalid JSON"})
+            return
+
+        config = self.server.config
+        rng = self.server.rng
+        with self.server.rng_lock:
+            fail = rng.random() < config.fail_rate
+            drop = rng.random() < config.drop_rate
+            num_predict = request.get("options", {}).get("num_predict") or config.tokens
+            words = [rng.choice(WORDS) for _ in range(min(config.tokens, num_predict))]
+            # Streamované spojení se utrhne uprostřed, ne-streamované před odpovědí
+            drop_at = rng.randrange(len(words)) if drop and words else None
+        self.server.count_request()
+
+        time.sleep(config.latency)
+        if fail:
+            self._send_json(500, {"error": "injected failure"})
+            return
+
+        chat = self.path == "/api/chat"
+        start = time.perf_counter_ns()
+
+        def record(text: str, done: bool) -> dict:
+            data = {"model": request.get("model", ""), "done": done}
+            if chat:
+                data["message"] = {"role": "assistant", "content": text}
+            else:
+                data["response"] = text
+            if done:
+                elapsed = time.perf_counter_ns() - start
+                data.update({
+                    "done_reason": "stop",
+                    "total_duration": elapsed,
+                    "eval_count": len(words),
+                    "eval_duration": elapsed,
+                })
+                if not chat:
+                    data["context"] = list(range(len(request.get("context") or []) + len(words)))
+            return data
+
+        if not request.get("stream", True):
+            time.sleep(len(words) / config.token_rate)
+            if drop:
+                self._drop()
+                return
+            self._send_json(200, record(" ".join(words), True))
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-ndjson")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        try:
+            for i, word in enumerate(words):
+                if i == drop_at:
+                    self._drop()
+                    return
+                self._send_chunk(record(word if i == 0 else " " + word, False))
+                time.sleep(1 / config.token_rate)
+            self._send_chunk(record("", True))
+            self.wfile.write(b"0\r\n\r\n")
+        except (BrokenPipeError, ConnectionResetError):
+            # Klient stream zrušil
+            self.close_connection = True
+
+
+class FakeOllamaServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int], config: FakeConfig):
+        super().__init__(address, FakeOllamaHandler)
+        self.config = config
+        self.rng = random.Random(config.seed)
+        self.rng_lock = threading.Lock()
+        self.requests = 0
+
+    def handle_error(self, request, client_address) -> None:
+        # Klient zavřel spojení (zrušený stream, ukončení testu) – není to chyba serveru
+        if not isinstance(sys.exc_info()[1], (ConnectionResetError, BrokenPipeError)):
+            super().handle_error(request, client_address)
+
+    def count_request(self) -> None:
+        with self.rng_lock:
+            self.requests += 1
+
+
+class FakeOllama:
+    """Spustí falešný server ve vlákně; `with FakeOllama() as url:`."""
+
+    def __init__(self, config: Optional[FakeConfig] = None, host: str = "127.0.0.1", port: int = 0):
+        self.server = FakeOllamaServer((host, port), config or FakeConfig())
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> str:
+        self._thread = threading.Thread(
+            target=self.server.serve_forever, name="fake-ollama", daemon=True
+        )
+        self._thread.start()
+        return self.url
+
+    def stop(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+    def __enter__(self) -> str:
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+
+def add_config_arguments(parser: argparse.ArgumentParser) -> None:
+    """Přepínače FakeConfig – sdílí je i ollama_load.py."""
+    parser.add_argument("--latency", type=float, default=0.1, help="Latence prvního tokenu (s)")
+    parser.add_argument("--token-rate", type=float, default=50.0, help="Tokenů za sekundu")
+    parser.add_argument("--tokens", type=int, default=30, help="Délka odpovědi v tokenech")
+    parser.add_argument("--fail-rate", type=float, default=0.0, help="Podíl odpovědí HTTP 500")
+    parser.add_argument("--drop-rate", type=float, default=0.0, help="Podíl utržených spojení")
+    parser.add_argument("--seed", type=int, help="Seed náhodných chyb a textu")
+
+
+def config_from_args(args: argparse.Namespace) -> FakeConfig:
+    return FakeConfig(
+        latency=args.latency,
+        token_rate=args.token_rate,
+        tokens=args.tokens,
+        fail_rate=args.fail_rate,
+        drop_rate=args.drop_rate,
+        seed=args.seed,
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Falešný Ollama server pro testy")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=11435)
+    add_config_arguments(parser)
+    args = parser.parse_args()
+
+    server = FakeOllamaServer((args.host, args.port), config_from_args(args))
+    print(f"🦙 Falešná Ollama běží na http://{args.host}:{args.port} (Ctrl+C ukončí)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
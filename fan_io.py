@@ -0,0 +1,297 @@
+"""
+Hromadný import/export fanoušků (CSV, JSONL, Parquet).
+Data tečou po dávkách – ani při 1M řádků se nedrží celý seznam v paměti:
+čtení po dávkách → validace dávky → zápis dávky v jedné transakci.
+
+    python fan_io.py import fans.csv
+    python fan_io.py --db fans_db.sqlite3 export fans.parquet
+
+Parquet vyžaduje volitelnou závislost pyarrow (pip install pyarrow).
+"""
+
+import argparse
+import csv
+import json
+import os
+from datetime import datetime
+from typing import Iterable, Iterator, Optional, TextIO
+
+from storage import DB_COLUMNS, SQLITE_FILE, TIERS, FanStorage, storage_for_path
+
+
+FORMATS = {
+    ".csv": "csv",
+    ".jsonl": "jsonl",
+    ".ndjson": "jsonl",
+    ".parquet": "parquet",
+}
+TRUE_VALUES = {"true", "1", "yes", "ano", "y", "a"}
+FALSE_VALUES = {"false", "0", "no", "ne", "n", ""}
+MAX_REPORTED_ERRORS = 20
+# Rozsah sloupce INTEGER v SQLite (int64)
+MAX_SUPPORT = 2**63 - 1
+
+
+def detect_format(path: str) -> str:
+    """Určí formát podle přípony souboru."""
+    ext = os.path.splitext(path)[1].lower()
+    if ext not in FORMATS:
+        raise ValueError(f"Neznámý formát souboru: {path} (podporováno: csv, jsonl, parquet)")
+    return FORMATS[ext]
+
+
+def _require_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError:
+        raise RuntimeError("Parquet vyžaduje pyarrow: pip install pyarrow") from None
+    return pyarrow
+
+
+def _chunks(rows: Iterable[dict], size: int) -> Iterator[list[dict]]:
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+# ============================================================================
+# VALIDACE
+# ============================================================================
+
+def validate_fan(raw: dict) -> dict:
+    """Převede surový řádek na fanouška ve schématu DB_COLUMNS. Při chybě ValueError."""
+    if not isinstance(raw, dict):
+        raise ValueError("řádek není JSON objekt")
+    nickname = str(raw.get("nickname") or "").strip()
+    if not nickname:
+        raise ValueError("chybí nickname")
+
+    tier_raw = str(raw.get("tier") or "Free").strip()
+    tier = next((t for t in TIERS if t.lower() == tier_raw.lower()), None)
+    if tier is None:
+        raise ValueError(f"neplatný tier '{tier_raw}'")
+
+    support_raw = raw.get("total_support")
+    if support_raw in (None, ""):
+        total_support = 0
+    else:
+        try:
+            # Čísla z JSON přímo, text jako celé číslo přesně (i velké),
+            # jinak přes float ("12.0", "1e3")
+            if isinstance(support_raw, (int, float)):
+                total_support = int(support_raw)
+            else:
+                text = str(support_raw).strip()
+                total_support = int(text) if text.lstrip("+-").isdigit() else int(float(text))
+        except (TypeError, ValueError, OverflowError):
+            # OverflowError: "inf", 1e400
+            raise ValueError(f"neplatná podpora '{support_raw}'") from None
+    if total_support < 0:
+        raise ValueError("podpora nesmí být záporná")
+    if total_support > MAX_SUPPORT:
+        raise ValueError(f"podpora '{support_raw}' je mimo rozsah")
+
+    telegram_raw = raw.get("migrate_telegram")
+    if isinstance(telegram_raw, bool):
+        migrate_telegram = telegram_raw
+    else:
+        value = str(telegram_raw if telegram_raw is not None else "").strip().lower()
+        if value in TRUE_VALUES:
+            migrate_telegram = True
+        elif value in FALSE_VALUES:
+            migrate_telegram = False
+        else:
+            raise ValueError(f"neplatná hodnota migrate_telegram '{telegram_raw}'")
+
+    created = str(raw.get("created") or "").strip()
+    if created:
+        try:
+            datetime.fromisoformat(created)
+        except ValueError:
+            raise ValueError(f"neplatné datum '{created}'") from None
+    else:
+        created = datetime.now().isoformat()
+
+    notes = raw.get("notes")
+    return {
+        "nickname": nickname,
+        "tier": tier,
+        "total_support": total_support,
+        "notes": "" if notes is None else str(notes).strip(),
+        "migrate_telegram": migrate_telegram,
+        "created": created,
+    }
+
+
+# ============================================================================
+# ČTENÍ
+# ============================================================================
+
+def _jsonl_rows(f: TextIO) -> Iterator[Optional[dict]]:
+    for line in f:
+        if not line.strip():
+            continue
+        try:
+            yield json.loads(line)
+        except ValueError:
+            # Neplatný řádek neukončí import – odmítne ho až validace
+            yield None
+
+
+def read_fans(path: str, fmt: Optional[str] = None, batch_size: int = 1000) -> Iterator[list[dict]]:
+    """Čte surové řádky souboru po dávkách."""
+    fmt = fmt or detect_format(path)
+    if fmt == "csv":
+        with open(path, "r", encoding="utf-8-sig", newline="") as f:
+            yield from _chunks(csv.DictReader(f), batch_size)
+    elif fmt == "jsonl":
+        with open(path, "r", encoding="utf-8") as f:
+            yield from _chunks(_jsonl_rows(f), batch_size)
+    elif fmt == "parquet":
+        pa = _require_pyarrow()
+        parquet_file = pa.parquet.ParquetFile(path)
+        for batch in parquet_file.iter_batches(batch_size=batch_size):
+            yield batch.to_pylist()
+    else:
+        raise ValueError(f"Neznámý formát: {fmt}")
+
+
+# ============================================================================
+# ZÁPIS
+# ============================================================================
+
+def write_csv(batches: Iterable[list[dict]], f: TextIO) -> int:
+    """Zapíše dávky fanoušků jako CSV do otevřeného souboru. Vrátí počet řádků."""
+    writer = csv.DictWriter(f, fieldnames=DB_COLUMNS, extrasaction="ignore")
+    writer.writeheader()
+    count = 0
+    for batch in batches:
+        writer.writerows(
+            {**fan, "migrate_telegram": str(bool(fan.get("migrate_telegram"))).lower()}
+            for fan in batch
+        )
+        count += len(batch)
+    return count
+
+
+def write_jsonl(batches: Iterable[list[dict]], f: TextIO) -> int:
+    """Zapíše dávky fanoušků jako JSON Lines. Vrátí počet řádků."""
+    count = 0
+    for batch in batches:
+        f.writelines(
+            json.dumps({c: fan.get(c) for c in DB_COLUMNS}, ensure_ascii=False) + "\n"
+            for fan in batch
+        )
+        count += len(batch)
+    return count
+
+
+def write_parquet(batches: Iterable[list[dict]], path: str) -> int:
+    """Zapíše dávky fanoušků do Parquet souboru (jedna row group na dávku)."""
+    pa = _require_pyarrow()
+    schema = pa.schema([
+        ("nickname", pa.string()),
+        ("tier", pa.string()),
+        ("total_support", pa.int64()),
+        ("notes", pa.string()),
+        ("migrate_telegram", pa.bool_()),
+        ("created", pa.string()),
+    ])
+    count = 0
+    with pa.parquet.ParquetWriter(path, schema) as writer:
+        for batch in batches:
+            writer.write_batch(pa.RecordBatch.from_pylist(batch, schema=schema))
+            count += len(batch)
+    return count
+
+
+def write_fans(batches: Iterable[list[dict]], path: str, fmt: Optional[str] = None) -> int:
+    """Zapíše dávky fanoušků do souboru ve zvoleném formátu."""
+    fmt = fmt or detect_format(path)
+    if fmt == "parquet":
+        return write_parquet(batches, path)
+    writers = {"csv": write_csv, "jsonl": write_jsonl}
+    if fmt not in writers:
+        raise ValueError(f"Neznámý formát: {fmt}")
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        return writers[fmt](batches, f)
+
+
+# ============================================================================
+# IMPORT / EXPORT
+# ============================================================================
+
+def import_fans(
+    storage: FanStorage,
+    path: str,
+    fmt: Optional[str] = None,
+    batch_size: int = 1000,
+) -> dict:
+    """
+    Streamovaný import: každá dávka se zvaliduje a zapíše jednou transakcí.
+    Vrátí statistiku (read, inserted, duplicates, invalid, errors).
+    """
+    stats = {"read": 0, "inserted": 0, "duplicates": 0, "invalid": 0, "errors": []}
+    for batch in read_fans(path, fmt, batch_size):
+        valid = []
+        for raw in batch:
+            stats["read"] += 1
+            try:
+                valid.append(validate_fan(raw))
+            except ValueError as e:
+                stats["invalid"] += 1
+                if len(stats["errors"]) < MAX_REPORTED_ERRORS:
+                    stats["errors"].append(f"řádek {stats['read']}: {e}")
+        inserted = storage.insert_many(valid)
+        stats["inserted"] += inserted
+        stats["duplicates"] += len(valid) - inserted
+    return stats
+
+
+def export_fans(
+    storage: FanStorage,
+    path: str,
+    fmt: Optional[str] = None,
+    batch_size: int = 1000,
+) -> int:
+    """Streamovaný export celé databáze. Vrátí počet exportovaných fanoušků."""
+    return write_fans(storage.iter_fans(batch_size), path, fmt)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Hromadný import/export fanoušků BaddieOS")
+    parser.add_argument("--db", default=SQLITE_FILE, help="Databáze (.sqlite3 nebo .json)")
+    parser.add_argument("--batch-size", type=int, default=1000, help="Velikost dávky")
+    parser.add_argument("--format", choices=sorted(set(FORMATS.values())), help="Vynutit formát")
+    sub = parser.add_subparsers(dest="command", required=True)
+    p_import = sub.add_parser("import", help="Importuje fanoušky ze souboru")
+    p_import.add_argument("path")
+    p_export = sub.add_parser("export", help="Exportuje fanoušky do souboru")
+    p_export.add_argument("path")
+    args = parser.parse_args()
+
+    storage = storage_for_path(args.db)
+    try:
+        if args.command == "import":
+            stats = import_fans(storage, args.path, args.format, args.batch_size)
+            print(
+                f"✅ Načteno {stats['read']}, vloženo {stats['inserted']}, "
+                f"duplicit {stats['duplicates']}, neplatných {stats['invalid']}"
+            )
+            for error in stats["errors"]:
+                print(f"⚠️ {error}")
+        else:
+            count = export_fans(storage, args.path, args.format, args.batch_size)
+            print(f"✅ Exportováno {count} fanoušků do {args.path}")
+    finally:
+        storage.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+DataFrame vrstva nad úložištěm – typovaný a seřazený DataFrame fanoušků
+v cache podle verze úložiště. Importuje pandas, proto ho načítá jen CRM
+(a benchmarky), ne db.py.
+"""
+
+import pandas as pd
+import streamlit as st
+
+import perf
+from db import get_storage, load_db
+from storage import DB_COLUMNS, TIERS, nickname_key
+
+
+def fans_to_df(fans: list) -> pd.DataFrame:
+    """Převede seznam fanoušků na typovaný DataFrame s indexem nickname_key."""
+    df = pd.DataFrame(fans, columns=DB_COLUMNS)
+    df["tier"] = pd.Categorical(df["tier"], categories=TIERS)
+    df["total_support"] = (
+        pd.to_numeric(df["total_support"], errors="coerce").fillna(0).astype("int64")
+    )
+    df["notes"] = df["notes"].fillna("").astype(str)
+    df["migrate_telegram"] = df["migrate_telegram"].fillna(False).astype(bool)
+    df["created"] = pd.to_datetime(df["created"], errors="coerce", format="ISO8601")
+    # Index = normalizovaný nickname (klíč z vyhledávacího indexu)
+    df.index = pd.Index(df["nickname"].map(nickname_key), name="key")
+    return df
+
+
+@st.cache_resource(max_entries=1, show_spinner=False)
+def _build_df(version: tuple) -> pd.DataFrame:
+    """Sestaví typovaný DataFrame. Přepočítá se jen při změně verze úložiště."""
+    return fans_to_df(load_db())
+
+
+@perf.timed("df.get")
+def get_df() -> pd.DataFrame:
+    """
+    Vrátí DataFrame s fanoušky.
+    Instance je sdílená napříč sessions – neupravovat in-place.
+    """
+    return _build_df(get_storage().version())
+
+
+@st.cache_resource(max_entries=6, show_spinner=False)
+def _build_sorted_df(version: tuple, sort_column: str, ascending: bool) -> pd.DataFrame:
+    """Seřazený DataFrame – řadí se jednou na verzi úložiště a klíč řazení."""
+    df = _build_df(version)
+    if sort_column == "nickname":
+        return df.sort_values(
+            "nickname", ascending=ascending, kind="stable", key=lambda s: s.str.casefold()
+        )
+    return df.sort_values(sort_column, ascending=ascending, kind="stable", na_position="last")
+
+
+@perf.timed("df.sorted")
+def get_sorted_df(sort_column: str, ascending: bool) -> pd.DataFrame:
+    """Vrátí DataFrame seřazený podle sloupce (sdílený – neupravovat in-place)."""
+    return _build_sorted_df(get_storage().version(), sort_column, ascending)
+
+
+def paginate(df: pd.DataFrame, page: int, page_size: int) -> pd.DataFrame:
+    """Vrátí jen řádky zvolené stránky (číslováno od 1)."""
+    start = (page - 1) * page_size
+    return df.iloc[start:start + page_size]
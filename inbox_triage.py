@@ -0,0 +1,54 @@
+"""
+Dávkové třídění inboxu – načtení exportu (CSV/JSONL) nebo vložených zpráv
+do DataFrame a vektorová klasifikace s drafty odpovědí.
+Importuje pandas – stránka ho načte až při prvním třídění.
+"""
+
+import random
+
+import pandas as pd
+
+import metrics
+from responses import CLASSIFIER
+from templates import RESPONSE_TEMPLATES
+
+
+# Sloupce exportovaného inboxu (CSV/JSONL), které se zkusí v tomto pořadí
+INBOX_MESSAGE_COLUMNS = ["message", "zprava", "zpráva", "text", "content", "body"]
+INBOX_SENDER_COLUMNS = ["nickname", "sender", "from", "od", "author"]
+# Chyby čtení nahraného souboru, které stránka ukáže uživateli
+READ_ERRORS = (ValueError, pd.errors.ParserError, pd.errors.EmptyDataError)
+
+
+def parse_inbox_text(text: str) -> pd.DataFrame:
+    """Vložený inbox – jedna zpráva na řádek."""
+    messages = [line.strip() for line in text.splitlines() if line.strip()]
+    return pd.DataFrame({"message": messages})
+
+
+def load_inbox_file(uploaded_file) -> pd.DataFrame:
+    """Načte exportovaný inbox (CSV nebo JSONL) do DataFrame se sloupcem message."""
+    if uploaded_file.name.lower().endswith((".jsonl", ".ndjson")):
+        raw = pd.read_json(uploaded_file, lines=True, dtype=False)
+    else:
+        raw = pd.read_csv(uploaded_file, dtype=str, keep_default_na=False)
+    if len(raw.columns) == 0:
+        # Prázdný soubor (i jen s mezerami) – stejná chyba jako nečitelný soubor
+        raise ValueError("soubor neobsahuje žádná data")
+    columns = {str(c).strip().lower(): c for c in raw.columns}
+    message_col = next((columns[c] for c in INBOX_MESSAGE_COLUMNS if c in columns), raw.columns[0])
+    sender_col = next((columns[c] for c in INBOX_SENDER_COLUMNS if c in columns), None)
+
+    inbox = pd.DataFrame({"message": raw[message_col].fillna("").astype(str).str.strip()})
+    if sender_col is not None:
+        inbox.insert(0, "sender", raw[sender_col].fillna("").astype(str))
+    return inbox[inbox["message"] != ""].reset_index(drop=True)
+
+
+def triage_inbox(inbox: pd.DataFrame) -> pd.DataFrame:
+    """Vektorově klasifikuje celý inbox a ke každé zprávě připraví draft odpovědi."""
+    result = inbox.copy()
+    result["category"] = CLASSIFIER.classify_series(result["message"])
+    metrics.record_classifications(result["category"])
+    result["response"] = [random.choice(RESPONSE_TEMPLATES[c]) for c in result["category"]]
+    return result
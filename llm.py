@@ -0,0 +1,104 @@
+"""
+Ollama v aplikaci – sdílený klient, vlákna pro volání modelu s limitem
+čekání a společné ovládací prvky stránek (přepínač + limit, popisek zdroje).
+"""
+
+import concurrent.futures
+import os
+from typing import Callable, Optional
+
+import streamlit as st
+
+import metrics
+import perf
+from ollama_client import OllamaClient
+from response_cache import ResponseCache
+
+
+OLLAMA_URL = os.environ.get("BADDIEOS_OLLAMA_URL", "http://localhost:11434")
+OLLAMA_MODEL = os.environ.get("BADDIEOS_OLLAMA_MODEL", "llama3.2")
+# Jak dlouho UI čeká na model, než použije šablonu (s)
+LLM_BUDGET = float(os.environ.get("BADDIEOS_LLM_BUDGET", "4.0"))
+# Perzistentní cache odpovědí – zapni BADDIEOS_LLM_CACHE=1
+LLM_CACHE_FILE = "ollama_cache.sqlite3"
+LLM_CACHE = os.environ.get("BADDIEOS_LLM_CACHE", "0") == "1"
+
+
+@st.cache_resource
+def get_ollama() -> OllamaClient:
+    """Sdílený Ollama klient (pool spojení, cache stavu serveru)."""
+    cache = ResponseCache(LLM_CACHE_FILE) if LLM_CACHE else None
+    if cache is not None:
+        # Hit rate cache odpovědí pro metrics.py (čte se až při exportu)
+        metrics.REGISTRY.add_collector(metrics.response_cache_collector(cache))
+    return OllamaClient(
+        base_url=OLLAMA_URL,
+        model=OLLAMA_MODEL,
+        connect_timeout=1.0,
+        keep_alive="30m",
+        cache=cache,
+    )
+
+
+@st.cache_resource
+def get_llm_executor() -> concurrent.futures.ThreadPoolExecutor:
+    """Vlákna pro volání modelu – UI na ně čeká jen do vypršení limitu."""
+    return concurrent.futures.ThreadPoolExecutor(max_workers=4, thread_name_prefix="baddieos-llm")
+
+
+def run_with_budget(
+    calls: list[Callable[[], Optional[str]]],
+    budget: float,
+) -> list[tuple[Optional[str], Optional[str]]]:
+    """
+    Spustí volání modelu souběžně a počká nejvýš `budget` sekund (společný deadline).
+    Pro každé volání vrátí (text, důvod fallbacku); text None = použij šablonu.
+    Volání, která nestihla limit, doběhnou na pozadí (a s cache se uloží na příště).
+    """
+    if not get_ollama().is_available():
+        return [(None, "Ollama nedostupná")] * len(calls)
+    executor = get_llm_executor()
+    futures = [executor.submit(perf.propagate(call)) for call in calls]
+    done, _ = concurrent.futures.wait(futures, timeout=budget)
+    results = []
+    for future in futures:
+        if future not in done:
+            future.cancel()
+            results.append((None, "vypršel limit"))
+        elif future.exception() is None and future.result():
+            results.append((future.result(), None))
+        else:
+            results.append((None, "chyba modelu"))
+    return results
+
+
+def llm_settings(key: str) -> tuple[bool, float]:
+    """Přepínač Ollama + limit čekání. Vrátí (use_llm, budget)."""
+    available = get_ollama().is_available()
+    use_llm = st.checkbox(
+        "🤖 Generovat přes Ollama",
+        value=available,
+        key=f"{key}_use_llm",
+        help=f"Model {OLLAMA_MODEL} na {OLLAMA_URL}. Bez Ollama se použijí šablony."
+    )
+    budget = st.slider(
+        "⏱ Limit čekání na AI (s)",
+        min_value=0.5,
+        max_value=30.0,
+        value=LLM_BUDGET,
+        step=0.5,
+        key=f"{key}_budget",
+        disabled=not use_llm
+    )
+    if use_llm and not available:
+        st.caption("⚠️ Ollama teď neběží – použijí se šablony.")
+    return use_llm, budget
+
+
+def source_caption(result: dict) -> str:
+    """Popisek, odkud text přišel a jak dlouho trval."""
+    if result["source"] == "ollama":
+        label = "🤖 Ollama"
+    else:
+        label = "📋 Šablona" + (f" ({result['fallback']})" if result["fallback"] else "")
+    return f"{label} · {result['elapsed_ms']:.0f} ms"
@@ -0,0 +1,432 @@
+"""
+Prometheus metriky procesu BaddieOS (textový formát 0.0.4, bez závislostí).
+
+- Latence úložiště, stránek a HTTP volání Ollamy přebírá z měření
+  perf.py (`install()` zaregistruje listener) – BADDIEOS_PERF=0 je vypne.
+- Chyby a tokeny/s Ollamy hlásí OllamaClient, počty klasifikací
+  a obsloužení zásobníku statusů app.
+- Velikost DB, počty fanoušků podle tier a statistiky cache odpovědí se
+  čtou až při exportu (collectory), běžný provoz za ně nic neplatí.
+
+Export:
+
+    server = serve(9464)                       # GET http://127.0.0.1:9464/metrics
+    server = serve(9464, host="0.0.0.0")       # i z jiných strojů (jen na důvěryhodné síti)
+    writer = TextfileWriter("/var/lib/node_exporter/baddieos.prom")
+"""
+
+import collections
+import math
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Iterable
+
+import perf
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+# Hranice histogramů latence v sekundách
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+TOKENS_PER_SECOND_BUCKETS = (1, 2, 5, 10, 20, 40, 80, 160, 320)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(names: tuple, values: tuple) -> str:
+    if not names:
+        return ""
+    return "{" + ",".join(f'{n}="{_escape(v)}"' for n, v in zip(names, values)) + "}"
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+# ============================================================================
+# TYPY METRIK
+# ============================================================================
+
+class Metric:
+    """Společný základ: název, popis, názvy labelů a hodnoty podle labelů."""
+
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values: dict[tuple, object] = {}
+        self._lock = threading.Lock()
+
+    def _key(self, labels: dict) -> tuple:
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+    def _samples(self) -> list[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [
+            f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+            for key, value in items
+        ]
+
+    def render(self) -> list[str]:
+        return [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.kind}",
+            *self._samples(),
+        ]
+
+
+class Counter(Metric):
+    """Jen rostoucí počítadlo (název končí _total)."""
+
+    kind = "counter"
+
+    def inc(self, amount: float = 1.0, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def set(self, value: float, **labels) -> None:
+        """Převezme hodnotu cizího počítadla (např. ResponseCache.stats())."""
+        with self._lock:
+            self._values[self._key(labels)] = value
+
+    def get(self, **labels) -> float:
+        with self._lock:
+            return self._values.get(self._key(labels), 0)
+
+
+class Gauge(Metric):
+    """Okamžitá hodnota."""
+
+    kind = "gauge"
+
+    def set(self, value: float, **labels) -> None:
+        with self._lock:
+            self._values[self._key(labels)] = value
+
+
+class Histogram(Metric):
+    """Kumulativní histogram s pevnými hranicemi košů."""
+
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple = (), buckets: tuple = LATENCY_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+
+    def observe(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                # [počty v koších (nekumulativně), součet, počet]
+                state = self._values[key] = [[0] * len(self.buckets), 0.0, 0]
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    state[0][i] += 1
+                    break
+            state[1] += value
+            state[2] += 1
+
+    def _samples(self) -> list[str]:
+        with self._lock:
+            items = sorted((key, ([*s[0]], s[1], s[2])) for key, s in self._values.items())
+        lines = []
+        names = self.labelnames + ("le",)
+        for key, (counts, total, count) in items:
+            cumulative = 0
+            for bound, n in zip(self.buckets, counts):
+                cumulative += n
+                labels = _format_labels(names, key + (_format_value(bound),))
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+            lines.append(f"{self.name}_count{labels} {count}")
+        return lines
+
+
+class HitRatio(Gauge):
+    """Podíl hit / (hit + miss) – počítá se z počítadla cache až při exportu."""
+
+    def __init__(self, name: str, documentation: str, requests: Counter):
+        super().__init__(name, documentation, ("cache",))
+        self.requests = requests
+
+    def _samples(self) -> list[str]:
+        with self.requests._lock:
+            values = dict(self.requests._values)
+        for cache in {key[0] for key in values}:
+            hits = values.get((cache, "hit"), 0)
+            lookups = hits + values.get((cache, "miss"), 0)
+            self.set(hits / lookups if lookups else 0.0, cache=cache)
+        return super()._samples()
+
+
+class Registry:
+    """Seznam metrik a collectorů, které se spustí před každým exportem."""
+
+    def __init__(self):
+        self.metrics: list[Metric] = []
+        self.collectors: list[Callable[[], None]] = []
+        self._lock = threading.Lock()
+
+    def register(self, metric: Metric) -> Metric:
+        self.metrics.append(metric)
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: tuple = ()) -> Counter:
+        return self.register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: tuple = ()) -> Gauge:
+        return self.register(Gauge(name, documentation, labelnames))
+
+    def histogram(
+        self, name: str, documentation: str, labelnames: tuple = (), buckets: tuple = LATENCY_BUCKETS
+    ) -> Histogram:
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def add_collector(self, collector: Callable[[], None]) -> None:
+        """Funkce, která těsně před exportem doplní gauge (velikost DB, počty…)."""
+        with self._lock:
+            self.collectors.append(collector)
+
+    def render(self) -> str:
+        """Všechny metriky v textovém formátu Prometheu."""
+        with self._lock:
+            collectors = list(self.collectors)
+        for collector in collectors:
+            try:
+                collector()
+            except Exception:
+                # Rozbitý collector nesmí shodit celý export
+                COLLECTOR_ERRORS.inc(collector=getattr(collector, "__name__", "collector"))
+        lines = []
+        for metric in self.metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+# ============================================================================
+# METRIKY BADDIEOS
+# ============================================================================
+
+REGISTRY = Registry()
+
+DB_OPERATION_SECONDS = REGISTRY.histogram(
+    "baddieos_db_operation_seconds", "Doba čtení/zápisu databáze fanoušků.", ("op",)
+)
+DB_SIZE_BYTES = REGISTRY.gauge(
+    "baddieos_db_size_bytes", "Velikost souborů databáze fanoušků na disku.", ("backend",)
+)
+FANS = REGISTRY.gauge("baddieos_fans", "Počet fanoušků podle tier.", ("tier",))
+CLASSIFICATIONS = REGISTRY.counter(
+    "baddieos_classifications_total", "Klasifikované zprávy podle kategorie.", ("category",)
+)
+OLLAMA_REQUEST_SECONDS = REGISTRY.histogram(
+    "baddieos_ollama_request_seconds",
+    "Doba HTTP volání Ollamy (u streamu do hlaviček odpovědi).",
+    ("endpoint",),
+)
+OLLAMA_ERRORS = REGISTRY.counter(
+    "baddieos_ollama_errors_total", "Neúspěšná volání Ollamy podle důvodu.", ("endpoint", "reason")
+)
+OLLAMA_TOKENS = REGISTRY.counter(
+    "baddieos_ollama_tokens_total", "Vygenerované tokeny (eval_count).", ("endpoint",)
+)
+OLLAMA_TOKENS_PER_SECOND = REGISTRY.histogram(
+    "baddieos_ollama_tokens_per_second",
+    "Rychlost generování jedné odpovědi (eval_count / eval_duration).",
+    ("endpoint",),
+    TOKENS_PER_SECOND_BUCKETS,
+)
+CACHE_REQUESTS = REGISTRY.counter(
+    "baddieos_cache_requests_total", "Dotazy do cache podle výsledku (hit/miss).", ("cache", "result")
+)
+CACHE_HIT_RATIO = REGISTRY.register(
+    HitRatio("baddieos_cache_hit_ratio", "Podíl zásahů cache od startu procesu.", CACHE_REQUESTS)
+)
+SPAN_SECONDS = REGISTRY.histogram(
+    "baddieos_span_seconds", "Doba ostatních měřených úseků (stránky, DataFrame, klasifikace).", ("span",)
+)
+COLLECTOR_ERRORS = REGISTRY.counter(
+    "baddieos_metrics_collector_errors_total", "Chyby collectorů při exportu.", ("collector",)
+)
+
+
+def _on_span(name: str, duration: float) -> None:
+    """Listener perf.py – rozdělí měření do histogramů podle prefixu."""
+    if name.startswith("db."):
+        DB_OPERATION_SECONDS.observe(duration, op=name[3:])
+    elif name.startswith("ollama."):
+        OLLAMA_REQUEST_SECONDS.observe(duration, endpoint=name[7:])
+    elif name != "classify":
+        # Klasifikace jedné zprávy je pod rozlišením histogramu – stačí počty
+        SPAN_SECONDS.observe(duration, span=name)
+
+
+_installed = False
+_install_lock = threading.Lock()
+
+
+def install() -> None:
+    """Napojí metriky na měření perf.py (stačí jednou za proces)."""
+    global _installed
+    with _install_lock:
+        if _installed:
+            return
+        perf.add_listener(_on_span)
+        _installed = True
+
+
+# ============================================================================
+# HLÁŠENÍ Z APLIKACE A KLIENTA
+# ============================================================================
+
+def record_classifications(categories: Iterable[str]) -> None:
+    for category, count in collections.Counter(categories).items():
+        CLASSIFICATIONS.inc(count, category=category)
+
+
+def record_cache(cache: str, hit: bool) -> None:
+    CACHE_REQUESTS.inc(cache=cache, result="hit" if hit else "miss")
+
+
+def record_ollama_error(endpoint: str, reason: str) -> None:
+    OLLAMA_ERRORS.inc(endpoint=endpoint, reason=reason)
+
+
+def record_ollama_result(endpoint: str, record: dict) -> None:
+    """Zpracuje poslední záznam odpovědi Ollamy (eval_count, eval_duration v ns)."""
+    tokens = record.get("eval_count")
+    duration = record.get("eval_duration")
+    if not tokens:
+        return
+    OLLAMA_TOKENS.inc(tokens, endpoint=endpoint)
+    if duration:
+        OLLAMA_TOKENS_PER_SECOND.observe(tokens / (duration / 1e9), endpoint=endpoint)
+
+
+def storage_collector(storage, aggregates=None) -> Callable[[], None]:
+    """
+    Collector velikosti DB a počtů fanoušků podle tier.
+    `aggregates` (FanAggregates) dá počty v O(1), jinak se spočítají z úložiště.
+    """
+    backend = type(storage).__name__.removesuffix("Storage").lower()
+    paths = [storage.path + suffix for suffix in ("", "-wal", "-journal", ".journal")]
+
+    def collect_storage() -> None:
+        DB_SIZE_BYTES.set(
+            sum(os.path.getsize(p) for p in paths if os.path.exists(p)), backend=backend
+        )
+        if aggregates is not None:
+            storage.sync_observers()
+            counts = aggregates.snapshot()["tier_counts"]
+        else:
+            counts = {}
+            for batch in storage.iter_fans():
+                for fan in batch:
+                    counts[fan.get("tier")] = counts.get(fan.get("tier"), 0) + 1
+        for tier, count in counts.items():
+            if tier is not None:
+                FANS.set(count, tier=tier)
+
+    return collect_storage
+
+
+def response_cache_collector(cache) -> Callable[[], None]:
+    """Collector hit/miss perzistentní cache odpovědí (ResponseCache)."""
+
+    def collect_response_cache() -> None:
+        stats = cache.stats()
+        CACHE_REQUESTS.set(stats["hits"], cache="ollama_response", result="hit")
+        CACHE_REQUESTS.set(stats["misses"], cache="ollama_response", result="miss")
+
+    return collect_response_cache
+
+
+# ============================================================================
+# EXPORT
+# ============================================================================
+
+class MetricsHandler(BaseHTTPRequestHandler):
+    server: "MetricsServer"
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        if self.path.split("?", 1)[0] not in ("/metrics", "/"):
+            self.send_error(404)
+            return
+        body = self.server.registry.render().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class MetricsServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int], registry: Registry):
+        super().__init__(address, MetricsHandler)
+        self.registry = registry
+
+    def stop(self) -> None:
+        self.shutdown()
+        self.server_close()
+
+
+def serve(port: int, host: str = "127.0.0.1", registry: Registry = REGISTRY) -> MetricsServer:
+    """
+    Spustí HTTP endpoint /metrics ve vlákně na pozadí.
+    Výchozí je jen localhost – na všech rozhraních až s host="0.0.0.0".
+    """
+    server = MetricsServer((host, port), registry)
+    threading.Thread(target=server.serve_forever, name="baddieos-metrics", daemon=True).start()
+    return server
+
+
+def write_textfile(path: str, registry: Registry = REGISTRY) -> None:
+    """Zapíše metriky atomicky (node_exporter nikdy nepřečte půlku souboru)."""
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(registry.render())
+    os.replace(tmp_path, path)
+
+
+class TextfileWriter:
+    """Přepisuje textfile s metrikami každých `interval` sekund."""
+
+    def __init__(self, path: str, interval: float = 15.0, registry: Registry = REGISTRY):
+        self.path = path
+        self.interval = interval
+        self.registry = registry
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._loop, name="baddieos-metrics-textfile", daemon=True)
+        self._thread.start()
+
+    def _loop(self) -> None:
+        while True:
+            try:
+                write_textfile(self.path, self.registry)
+            except OSError:
+                pass
+            if self._stop.wait(self.interval):
+                return
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join()
+        write_textfile(self.path, self.registry)
@@ -2,97 +2,727 @@
 Ollama API klient pro BaddieOS.
 Komunikuje s lokálním Ollama serverem pro generování textu.
 Fallback: pokud Ollama neběží, vrátí None – app použije šablony.
+
+Stav serveru (/api/tags) se cachuje sdíleně pro celý proces (ServerProbe
+pro každou base_url), takže Streamlit rerun ani další session nečeká na
+timeout, když Ollama neběží.
 """
 
+import asyncio
+import json
+import threading
+import time
 import requests
-from typing import Optional
+from requests.adapters import HTTPAdapter
+from typing import Callable, Iterator, Optional, Union
+
+from metrics import record_ollama_error, record_ollama_result
+from perf import span
+from response_cache import ResponseCache, make_key
+
+# (connect, read) v sekundách, nebo jedno číslo pro obojí – jako v requests
+Timeout = Union[float, tuple[float, float]]
+
+PROBE_TTL = 30.0            # jak dlouho platí zjištěný stav serveru (s)
+PROBE_TIMEOUT = (1.0, 5.0)  # timeout živé kontroly /api/tags
+BREAKER_THRESHOLD = 3       # po kolika chybách spojení za sebou se jistič rozepne
+BREAKER_COOLDOWN = 30.0     # jak dlouho pak dotazy rovnou selhávají (s)
+
+
+class ServerProbe:
+    """
+    Sdílený stav jednoho Ollama serveru: TTL cache dostupnosti a seznamu
+    modelů + jistič (circuit breaker). Po BREAKER_THRESHOLD chybách spojení
+    za sebou vrací dotazy po dobu BREAKER_COOLDOWN okamžitě "nedostupné";
+    pak se pustí jeden zkušební dotaz. Vlákno na pozadí drží cache čerstvou,
+    takže UI živý dotaz v běžném provozu vůbec neplatí.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        ttl: float = PROBE_TTL,
+        timeout: Timeout = PROBE_TIMEOUT,
+        failure_threshold: int = BREAKER_THRESHOLD,
+        cooldown: float = BREAKER_COOLDOWN,
+    ):
+        self.base_url = base_url
+        self.ttl = ttl
+        self.timeout = timeout
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+        self._session = requests.Session()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        self.available = False
+        self.models: list[str] = []
+        self.checked_at: Optional[float] = None
+        self.failures = 0
+        self.open_until = 0.0
+
+    @property
+    def circuit_open(self) -> bool:
+        """True = jistič rozepnutý, dotazy rovnou selhávají."""
+        return time.monotonic() < self.open_until
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.failures = 0
+            self.open_until = 0.0
+
+    def record_failure(self) -> None:
+        """Zaznamená chybu spojení; po dosažení limitu rozepne jistič."""
+        with self._lock:
+            self.failures += 1
+            if self.failures >= self.failure_threshold:
+                self.open_until = time.monotonic() + self.cooldown
+                self.available = False
+                self.models = []
+                self.checked_at = time.monotonic()
+
+    def refresh(self, timeout: Optional[Timeout] = None) -> bool:
+        """Živě zkontroluje /api/tags a aktualizuje cache. Vrátí dostupnost."""
+        with self._refresh_lock:
+            available, models = False, []
+            try:
+                with span("ollama.tags"):
+                    r = self._session.get(f"{self.base_url}/api/tags", timeout=timeout or self.timeout)
+                available = r.status_code == 200
+                if available:
+                    models = [m["name"] for m in r.json().get("models", [])]
+            except (requests.ConnectionError, requests.Timeout) as e:
+                self.record_failure()
+                record_ollama_error("tags", "timeout" if isinstance(e, requests.Timeout) else "connection")
+                available = False
+            except ValueError:
+                record_ollama_error("tags", "invalid_response")
+            else:
+                self.record_success()
+            with self._lock:
+                self.available = available
+                self.models = models
+                self.checked_at = time.monotonic()
+            return available
+
+    def status(self, timeout: Optional[Timeout] = None) -> tuple[bool, list[str]]:
+        """
+        (dostupnost, modely) z cache. Živý dotaz jen když cache chybí nebo
+        vypršela a jistič je sepnutý; s rozepnutým jističem vrací hned (False, []).
+        """
+        self.start_refresher()
+        if self.circuit_open:
+            return False, []
+        with self._lock:
+            if self.checked_at is not None and time.monotonic() - self.checked_at < self.ttl:
+                return self.available, list(self.models)
+        self.refresh(timeout)
+        with self._lock:
+            return self.available, list(self.models)
+
+    def start_refresher(self) -> None:
+        """Spustí (jednou) vlákno, které obnovuje cache každou polovinu TTL."""
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(
+                target=self._refresh_loop, name=f"ollama-probe {self.base_url}", daemon=True
+            )
+            self._thread.start()
+
+    def _refresh_loop(self) -> None:
+        while not self._stop.wait(self.ttl / 2):
+            if not self.circuit_open:
+                self.refresh()
+
+    def stop(self) -> None:
+        """Zastaví obnovovací vlákno."""
+        self._stop.set()
+
+
+_probes: dict[str, ServerProbe] = {}
+_probes_lock = threading.Lock()
+
+
+def get_probe(base_url: str) -> ServerProbe:
+    """Sdílený ServerProbe pro danou base_url (jeden na proces)."""
+    base_url = base_url.rstrip("/")
+    with _probes_lock:
+        probe = _probes.get(base_url)
+        if probe is None:
+            probe = _probes[base_url] = ServerProbe(base_url)
+        return probe
+
+
+class OllamaStream:
+    """
+    Streamovaná odpověď Ollamy (NDJSON – jeden JSON objekt na řádek).
+    Iterací dostáváš kousky textu hned, jak je model vygeneruje; `text`
+    drží dosud složený text, `result()` dočte zbytek a vrátí celý výsledek.
+    cancel() přeruší generování a zavře spojení (lze volat i z jiného vlákna).
+    Čtení je jedno na celý stream – po `break` z cyklu pokračuje další
+    iterace (nebo result()) tam, kde se skončilo.
+    """
+
+    def __init__(
+        self,
+        response: requests.Response,
+        extract: Callable[[dict], str],
+        endpoint: str = "stream",
+    ):
+        self._response = response
+        self._extract = extract
+        self._endpoint = endpoint   # label pro metrics.py
+        self._chunks: list[str] = []
+        self._reader = self._read()
+        self.done = False       # server poslal poslední záznam (done: true)
+        self.cancelled = False
+        self.failed = False     # spojení spadlo nebo server vrátil chybu
+        self.stats: dict = {}   # metadata posledního záznamu (eval_count, total_duration…)
+
+    def __enter__(self) -> "OllamaStream":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.cancel()
+
+    def __iter__(self) -> Iterator[str]:
+        return self._reader
+
+    def _read(self) -> Iterator[str]:
+        try:
+            for line in self._response.iter_lines():
+                if self.cancelled:
+                    break
+                # Po posledním záznamu se dočte konec odpovědi, aby se
+                # keep-alive spojení vrátilo do poolu místo zavření
+                if not line or self.done:
+                    continue
+                data = json.loads(line)
+                if "error" in data:
+                    self.failed = True
+                    break
+                chunk = self._extract(data)
+                if chunk:
+                    self._chunks.append(chunk)
+                    yield chunk
+                if data.get("done"):
+                    self.done = True
+                    self.stats = {
+                        k: v for k, v in data.items()
+                        if k not in ("response", "message", "context")
+                    }
+        except (requests.RequestException, ValueError, AttributeError):
+            # AttributeError: urllib3 po zavření spojení z jiného vlákna (cancel)
+            if not self.cancelled:
+                self.failed = True
+        finally:
+            self._response.close()
+            if self.done:
+                record_ollama_result(self._endpoint, self.stats)
+            elif self.failed:
+                record_ollama_error(self._endpoint, "stream_broken")
+
+    @property
+    def text(self) -> str:
+        """Dosud přijatý text."""
+        return "".join(self._chunks)
+
+    def cancel(self) -> None:
+        """Přeruší stream – Ollama po zavření spojení přestane generovat."""
+        if not self.done:
+            self.cancelled = True
+        self._response.close()
+
+    def result(self) -> Optional[str]:
+        """Dočte stream a vrátí celý text (po cancel() to, co stihlo dorazit). None při chybě."""
+        for _ in self:
+            pass
+        if self.failed:
+            return None
+        return self.text.strip()
 
 
 class OllamaClient:
-    """Klient pro komunikaci s Ollama REST API."""
+    """
+    Klient pro komunikaci s Ollama REST API.
+    Drží vlastní requests.Session s poolem keep-alive spojení, takže se TCP
+    spojení nenavazuje znovu pro každý dotaz. Po použití zavolej close()
+    (nebo použij `with OllamaClient() as client:`).
+    S `cache=ResponseCache()` vrací generate/chat opakované dotazy z cache.
+    `keep_alive` (např. "30m", -1 = navždy) drží model v paměti serveru mezi dotazy.
+    """
 
     def __init__(
         self,
         base_url: str = "http://localhost:11434",
         model: str = "llama3.2",
         temperature: float = 0.8,
+        pool_size: int = 4,
+        connect_timeout: float = 5.0,
+        read_timeout: float = 60.0,
+        probe_timeout: float = 5.0,
+        cache: Optional[ResponseCache] = None,
+        keep_alive: Optional[Union[str, int]] = None,
     ):
         self.base_url = base_url.rstrip("/")
         self.model = model
         self.temperature = temperature
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.probe_timeout = probe_timeout
+        self.probe = get_probe(self.base_url)
+        self.cache = cache
+        self.keep_alive = keep_alive
 
-    def is_available(self) -> bool:
-        """Zkontroluje dostupnost Ollama serveru."""
-        try:
-            r = requests.get(f"{self.base_url}/api/tags", timeout=5)
-            return r.status_code == 200
-        except (requests.ConnectionError, requests.Timeout):
-            return False
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
 
-    def get_models(self) -> list[str]:
-        """Vrátí seznam dostupných modelů."""
+    def close(self) -> None:
+        """Zavře všechna spojení v poolu."""
+        self.session.close()
+
+    def __enter__(self) -> "OllamaClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _post(self, path: str, payload: dict, timeout: Timeout) -> requests.Response:
+        with span("ollama." + path.rsplit("/", 1)[-1]):
+            return self.session.post(f"{self.base_url}{path}", json=payload, timeout=timeout)
+
+    def _complete(
+        self,
+        path: str,
+        payload: dict,
+        timeout: Timeout,
+        extract: Callable[[dict], str],
+        bypass_cache: bool,
+    ) -> Optional[str]:
+        key = make_key({"path": path, **payload}) if self.cache is not None else None
+        if key is not None and not bypass_cache:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+        endpoint = path.rsplit("/", 1)[-1]
+        if self.probe.circuit_open:
+            record_ollama_error(endpoint, "circuit_open")
+            return None
         try:
-            r = requests.get(f"{self.base_url}/api/tags", timeout=5)
+            r = self._post(path, payload, timeout)
+            self.probe.record_success()
             if r.status_code == 200:
                 data = r.json()
-                return [m["name"] for m in data.get("models", [])]
-        except (requests.ConnectionError, requests.Timeout, ValueError):
-            pass
-        return []
+                record_ollama_result(endpoint, data)
+                text = extract(data).strip()
+                if key is not None:
+                    self.cache.put(key, text)
+                return text
+            record_ollama_error(endpoint, f"http_{r.status_code}")
+        except requests.ConnectionError:
+            self.probe.record_failure()
+            record_ollama_error(endpoint, "connection")
+        except requests.Timeout:
+            record_ollama_error(endpoint, "timeout")
+        except ValueError:
+            record_ollama_error(endpoint, "invalid_response")
+        return None
+
+    def _stream(
+        self,
+        path: str,
+        payload: dict,
+        timeout: Timeout,
+        extract: Callable[[dict], str],
+    ) -> Optional[OllamaStream]:
+        endpoint = path.rsplit("/", 1)[-1] + ".stream"
+        if self.probe.circuit_open:
+            record_ollama_error(endpoint, "circuit_open")
+            return None
+        try:
+            # Měří se jen čas do hlaviček odpovědi, ne čtení streamu
+            with span("ollama." + endpoint):
+                r = self.session.post(
+                    f"{self.base_url}{path}", json=payload, timeout=timeout, stream=True
+                )
+        except requests.ConnectionError:
+            self.probe.record_failure()
+            record_ollama_error(endpoint, "connection")
+            return None
+        except requests.Timeout:
+            record_ollama_error(endpoint, "timeout")
+            return None
+        self.probe.record_success()
+        if r.status_code != 200:
+            record_ollama_error(endpoint, f"http_{r.status_code}")
+            r.close()
+            return None
+        return OllamaStream(r, extract, endpoint)
+
+    def _generate_payload(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        max_tokens: int,
+        stream: bool,
+        context: Optional[list[int]] = None,
+    ) -> dict:
+        payload = {
+            "model": self.model,
+            "prompt": user_prompt,
+            "system": system_prompt,
+            "stream": stream,
+            "options": {
+                "temperature": self.temperature,
+                "num_predict": max_tokens,
+            },
+        }
+        if context:
+            payload["context"] = context
+        if self.keep_alive is not None:
+            payload["keep_alive"] = self.keep_alive
+        return payload
+
+    def _chat_payload(self, messages: list[dict], system_prompt: str, stream: bool) -> dict:
+        all_messages = []
+        if system_prompt:
+            all_messages.append({"role": "system", "content": system_prompt})
+        all_messages.extend(messages)
+        payload = {
+            "model": self.model,
+            "messages": all_messages,
+            "stream": stream,
+            "options": {"temperature": self.temperature},
+        }
+        if self.keep_alive is not None:
+            payload["keep_alive"] = self.keep_alive
+        return payload
+
+    def is_available(self, timeout: Optional[Timeout] = None, refresh: bool = False) -> bool:
+        """Zkontroluje dostupnost Ollama serveru (ze sdílené cache, refresh=True = živě)."""
+        timeout = timeout or (self.connect_timeout, self.probe_timeout)
+        if refresh:
+            return self.probe.refresh(timeout)
+        return self.probe.status(timeout)[0]
+
+    def get_models(self, timeout: Optional[Timeout] = None, refresh: bool = False) -> list[str]:
+        """Vrátí seznam dostupných modelů (ze sdílené cache, refresh=True = živě)."""
+        timeout = timeout or (self.connect_timeout, self.probe_timeout)
+        if refresh:
+            self.probe.refresh(timeout)
+        return self.probe.status(timeout)[1]
 
     def generate(
         self,
         system_prompt: str,
         user_prompt: str,
         max_tokens: int = 500,
+        timeout: Optional[Timeout] = None,
+        bypass_cache: bool = False,
     ) -> Optional[str]:
-        """Generuje text. Vrátí None při chybě."""
-        try:
-            payload = {
-                "model": self.model,
-                "prompt": user_prompt,
-                "system": system_prompt,
-                "stream": False,
-                "options": {
-                    "temperature": self.temperature,
-                    "num_predict": max_tokens,
-                },
-            }
-            r = requests.post(
-                f"{self.base_url}/api/generate",
-                json=payload,
-                timeout=60,
-            )
-            if r.status_code == 200:
-                return r.json().get("response", "").strip()
-        except (requests.ConnectionError, requests.Timeout, ValueError):
-            pass
-        return None
+        """
+        Generuje text. Vrátí None při chybě.
+        bypass_cache=True ignoruje uloženou odpověď (nová varianta) a přepíše ji.
+        """
+        return self._complete(
+            "/api/generate",
+            self._generate_payload(system_prompt, user_prompt, max_tokens, False),
+            timeout or (self.connect_timeout, self.read_timeout),
+            lambda data: data.get("response", ""),
+            bypass_cache,
+        )
 
     def chat(
         self,
         messages: list[dict],
         system_prompt: str = "",
+        timeout: Optional[Timeout] = None,
+        bypass_cache: bool = False,
     ) -> Optional[str]:
         """Chat completion. Vrátí None při chybě."""
+        return self._complete(
+            "/api/chat",
+            self._chat_payload(messages, system_prompt, False),
+            timeout or (self.connect_timeout, self.read_timeout),
+            lambda data: data.get("message", {}).get("content", ""),
+            bypass_cache,
+        )
+
+    def generate_stream(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        max_tokens: int = 500,
+        timeout: Optional[Timeout] = None,
+    ) -> Optional[OllamaStream]:
+        """
+        Streamovaná varianta generate(). Vrátí None, pokud se stream nepodaří otevřít.
+        Read timeout tu platí pro čekání na každý další kousek, ne na celou odpověď.
+        """
+        payload = self._generate_payload(system_prompt, user_prompt, max_tokens, True)
+        return self._stream(
+            "/api/generate",
+            payload,
+            timeout or (self.connect_timeout, self.read_timeout),
+            lambda data: data.get("response", ""),
+        )
+
+    def chat_stream(
+        self,
+        messages: list[dict],
+        system_prompt: str = "",
+        timeout: Optional[Timeout] = None,
+    ) -> Optional[OllamaStream]:
+        """Streamovaná varianta chat(). Vrátí None, pokud se stream nepodaří otevřít."""
+        payload = self._chat_payload(messages, system_prompt, True)
+        return self._stream(
+            "/api/chat",
+            payload,
+            timeout or (self.connect_timeout, self.read_timeout),
+            lambda data: data.get("message", {}).get("content", ""),
+        )
+
+
+class PersonaSession:
+    """
+    Konverzace vázaná na jednu personu.
+    System prompt a lore persony se pošlou (prefillnou) jen jednou přes
+    prefill(); Ollama vrátí `context` (tokeny hotového prefixu) a další
+    odpovědi fanouškům na něj navazují – server pak zpracovává jen novou
+    zprávu. Model drží v paměti `keep_alive`, takže se mezi zprávami
+    neuvolní ani KV cache.
+
+    Každá odpověď navazuje na stejný prefix (ne na předchozí odpověď),
+    fanoušci se tedy navzájem neovlivňují. Když prefill selže, generate()
+    posílá system prompt s každým dotazem jako dřív.
+    """
+
+    def __init__(
+        self,
+        client: OllamaClient,
+        system_prompt: str,
+        lore: str = "",
+        keep_alive: Union[str, int] = "30m",
+    ):
+        self.client = client
+        self.system_prompt = system_prompt
+        self.lore = lore
+        self.keep_alive = keep_alive
+        self.context: Optional[list[int]] = None
+
+    def _timeout(self, timeout: Optional[Timeout]) -> Timeout:
+        return timeout or (self.client.connect_timeout, self.client.read_timeout)
+
+    def prefill(self, timeout: Optional[Timeout] = None) -> bool:
+        """Jednou zpracuje system prompt + lore a uloží context. Vrátí True při úspěchu."""
+        if self.client.probe.circuit_open:
+            return False
+        payload = self.client._generate_payload(
+            self.system_prompt, self.lore or " ", 1, False
+        )
+        payload["keep_alive"] = self.keep_alive
         try:
-            all_messages = []
-            if system_prompt:
-                all_messages.append({"role": "system", "content": system_prompt})
-            all_messages.extend(messages)
-            payload = {
-                "model": self.model,
-                "messages": all_messages,
-                "stream": False,
-                "options": {"temperature": self.temperature},
-            }
-            r = requests.post(
-                f"{self.base_url}/api/chat",
-                json=payload,
-                timeout=60,
-            )
+            r = self.client._post("/api/generate", payload, self._timeout(timeout))
+            self.client.probe.record_success()
             if r.status_code == 200:
-                return r.json().get("message", {}).get("content", "").strip()
-        except (requests.ConnectionError, requests.Timeout, ValueError):
+                self.context = r.json().get("context") or None
+        except requests.ConnectionError:
+            self.client.probe.record_failure()
+        except (requests.Timeout, ValueError):
             pass
-        return None
+        return self.context is not None
+
+    def reset(self) -> None:
+        """Zahodí context (např. po změně persony) – příští prefill začne znovu."""
+        self.context = None
+
+    def _payload(self, user_prompt: str, max_tokens: int, stream: bool) -> dict:
+        if self.context is None:
+            payload = self.client._generate_payload(
+                self.system_prompt, user_prompt, max_tokens, stream
+            )
+        else:
+            # System prompt už je v contextu
+            payload = self.client._generate_payload(
+                "", user_prompt, max_tokens, stream, context=self.context
+            )
+        payload["keep_alive"] = self.keep_alive
+        return payload
+
+    def generate(
+        self,
+        user_prompt: str,
+        max_tokens: int = 500,
+        timeout: Optional[Timeout] = None,
+        bypass_cache: bool = False,
+    ) -> Optional[str]:
+        """Odpověď v kontextu persony. Vrátí None při chybě."""
+        payload = self._payload(user_prompt, max_tokens, False)
+        return self.client._complete(
+            "/api/generate",
+            payload,
+            self._timeout(timeout),
+            lambda data: data.get("response", ""),
+            bypass_cache,
+        )
+
+    def generate_stream(
+        self,
+        user_prompt: str,
+        max_tokens: int = 500,
+        timeout: Optional[Timeout] = None,
+    ) -> Optional[OllamaStream]:
+        """Streamovaná odpověď v kontextu persony (bez cache). None, pokud se stream neotevře."""
+        return self.client._stream(
+            "/api/generate",
+            self._payload(user_prompt, max_tokens, True),
+            self._timeout(timeout),
+            lambda data: data.get("response", ""),
+        )
+
+    def chat(
+        self,
+        messages: list[dict],
+        timeout: Optional[Timeout] = None,
+        bypass_cache: bool = False,
+    ) -> Optional[str]:
+        """
+        Chat s personou. /api/chat context nepřijímá – prefix se znovu použije
+        díky tomu, že system prompt je pořád stejný a model zůstává načtený
+        (Ollama sdílí KV cache pro shodný začátek promptu).
+        """
+        payload = self.client._chat_payload(messages, self.system_prompt, False)
+        payload["keep_alive"] = self.keep_alive
+        return self.client._complete(
+            "/api/chat",
+            payload,
+            self._timeout(timeout),
+            lambda data: data.get("message", {}).get("content", ""),
+            bypass_cache,
+        )
+
+
+class AsyncOllamaClient:
+    """
+    Asyncio varianta OllamaClient se stejným API (is_available, get_models,
+    generate, chat) a limitem souběžných dotazů (semafor).
+
+    Projekt nemá async HTTP závislost, takže dotazy běží přes
+    asyncio.to_thread nad sdíleným OllamaClient – pool keep-alive spojení
+    je dimenzovaný na `concurrency`. Zrušená korutina nepřeruší už běžící
+    HTTP dotaz, jen se nečeká na jeho výsledek.
+    """
+
+    def __init__(
+        self,
+        base_url: str = "http://localhost:11434",
+        model: str = "llama3.2",
+        temperature: float = 0.8,
+        concurrency: int = 4,
+        connect_timeout: float = 5.0,
+        read_timeout: float = 60.0,
+        probe_timeout: float = 5.0,
+        cache: Optional[ResponseCache] = None,
+    ):
+        self.concurrency = concurrency
+        self.client = OllamaClient(
+            base_url=base_url,
+            model=model,
+            temperature=temperature,
+            pool_size=concurrency,
+            connect_timeout=connect_timeout,
+            read_timeout=read_timeout,
+            probe_timeout=probe_timeout,
+            cache=cache,
+        )
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._semaphore_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def close(self) -> None:
+        """Zavře všechna spojení v poolu."""
+        self.client.close()
+
+    async def aclose(self) -> None:
+        self.close()
+
+    async def __aenter__(self) -> "AsyncOllamaClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        self.close()
+
+    async def _run(self, func: Callable, *args, **kwargs):
+        loop = asyncio.get_running_loop()
+        if self._semaphore_loop is not loop:
+            # Semafor patří ke smyčce – každé asyncio.run() dostane vlastní
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+            self._semaphore_loop = loop
+        async with self._semaphore:
+            return await asyncio.to_thread(func, *args, **kwargs)
+
+    async def is_available(self, timeout: Optional[Timeout] = None, refresh: bool = False) -> bool:
+        """Zkontroluje dostupnost Ollama serveru."""
+        return await self._run(self.client.is_available, timeout, refresh)
+
+    async def get_models(self, timeout: Optional[Timeout] = None, refresh: bool = False) -> list[str]:
+        """Vrátí seznam dostupných modelů."""
+        return await self._run(self.client.get_models, timeout, refresh)
+
+    async def generate(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        max_tokens: int = 500,
+        timeout: Optional[Timeout] = None,
+        bypass_cache: bool = False,
+    ) -> Optional[str]:
+        """Generuje text. Vrátí None při chybě."""
+        return await self._run(
+            self.client.generate, system_prompt, user_prompt, max_tokens, timeout, bypass_cache
+        )
+
+    async def chat(
+        self,
+        messages: list[dict],
+        system_prompt: str = "",
+        timeout: Optional[Timeout] = None,
+        bypass_cache: bool = False,
+    ) -> Optional[str]:
+        """Chat completion. Vrátí None při chybě."""
+        return await self._run(self.client.chat, messages, system_prompt, timeout, bypass_cache)
+
+    async def agenerate_many(
+        self,
+        system_prompt: str,
+        user_prompts: list[str],
+        max_tokens: int = 500,
+        timeout: Optional[Timeout] = None,
+        bypass_cache: bool = False,
+    ) -> list[Optional[str]]:
+        """
+        Vygeneruje odpovědi na více promptů souběžně (nejvýš `concurrency` naráz).
+        Výsledky jsou ve stejném pořadí jako prompty, None = chyba u daného promptu.
+        """
+        return await asyncio.gather(*(
+            self.generate(system_prompt, prompt, max_tokens, timeout, bypass_cache)
+            for prompt in user_prompts
+        ))
+
+    def generate_many(
+        self,
+        system_prompt: str,
+        user_prompts: list[str],
+        max_tokens: int = 500,
+        timeout: Optional[Timeout] = None,
+        bypass_cache: bool = False,
+    ) -> list[Optional[str]]:
+        """Synchronní obal agenerate_many pro kód bez event loopu (Streamlit skript)."""
+        return asyncio.run(
+            self.agenerate_many(system_prompt, user_prompts, max_tokens, timeout, bypass_cache)
+        )
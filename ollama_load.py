@@ -0,0 +1,151 @@
+"""
+Zátěžový test OllamaClient.
+Pro každou úroveň souběžnosti pošle N dotazů a vypíše latence p50/p95/p99,
+propustnost a chybovost; ve streamovaném režimu i čas do prvního tokenu.
+
+    python ollama_load.py                                   # proti falešné Ollamě (fake_ollama.py)
+    python ollama_load.py --concurrency 1,4,16 --requests 200 --mode stream --fail-rate 0.02
+    python ollama_load.py --url http://localhost:11434 --mode chat --requests 20
+
+Bez --url se spustí falešný server ve stejném procesu s parametry
+--latency/--token-rate/--tokens/--fail-rate/--drop-rate.
+"""
+
+import argparse
+import json
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+from fake_ollama import FakeOllama, add_config_arguments, config_from_args
+from ollama_client import OllamaClient, get_probe
+
+MODES = ["generate", "chat", "stream"]
+SYSTEM_PROMPT = "Jsi sebevědomá digitální influencerka. Odpovídej česky a krátce."
+PROMPT = "Napiš krátký status na večer."
+
+
+def percentiles(values: list[float]) -> dict:
+    """p50/p95/p99 v milisekundách."""
+    if not values:
+        return {"p50": None, "p95": None, "p99": None}
+    if len(values) == 1:
+        ms = values[0] * 1000
+        return {"p50": ms, "p95": ms, "p99": ms}
+    q = statistics.quantiles(values, n=100, method="inclusive")
+    return {"p50": q[49] * 1000, "p95": q[94] * 1000, "p99": q[98] * 1000}
+
+
+def one_request(client: OllamaClient, mode: str, max_tokens: int) -> dict:
+    """Jeden dotaz: latence, čas do prvního tokenu, počet kousků, úspěch."""
+    start = time.perf_counter()
+    ttft = None
+    chunks = 0
+    if mode == "generate":
+        ok = client.generate(SYSTEM_PROMPT, PROMPT, max_tokens=max_tokens) is not None
+    elif mode == "chat":
+        messages = [{"role": "user", "content": PROMPT}]
+        ok = client.chat(messages, system_prompt=SYSTEM_PROMPT) is not None
+    else:
+        stream = client.generate_stream(SYSTEM_PROMPT, PROMPT, max_tokens=max_tokens)
+        ok = False
+        if stream is not None:
+            for _ in stream:
+                if ttft is None:
+                    ttft = time.perf_counter() - start
+                chunks += 1
+            ok = stream.result() is not None
+    return {"latency": time.perf_counter() - start, "ttft": ttft, "chunks": chunks, "ok": ok}
+
+
+def run_level(
+    url: str,
+    mode: str,
+    concurrency: int,
+    requests: int,
+    max_tokens: int,
+    warmup: int,
+) -> dict:
+    """Změří jednu úroveň souběžnosti."""
+    # Jistič je sdílený pro base_url – každá úroveň začíná se sepnutým
+    get_probe(url).record_success()
+    with OllamaClient(base_url=url, pool_size=concurrency) as client, \
+            ThreadPoolExecutor(max_workers=concurrency) as executor:
+        list(executor.map(lambda _: one_request(client, mode, max_tokens), range(warmup)))
+        start = time.perf_counter()
+        results = list(executor.map(lambda _: one_request(client, mode, max_tokens), range(requests)))
+        wall = time.perf_counter() - start
+
+    ok = [r for r in results if r["ok"]]
+    report = {
+        "mode": mode,
+        "concurrency": concurrency,
+        "requests": requests,
+        "ok": len(ok),
+        "errors": requests - len(ok),
+        "error_rate": (requests - len(ok)) / requests if requests else 0.0,
+        "wall_s": wall,
+        "throughput_rps": len(ok) / wall if wall > 0 else None,
+        "latency_ms": percentiles([r["latency"] for r in ok]),
+    }
+    if mode == "stream":
+        report["ttft_ms"] = percentiles([r["ttft"] for r in ok if r["ttft"] is not None])
+        report["chunks_per_sec"] = sum(r["chunks"] for r in ok) / wall if wall > 0 else None
+    return report
+
+
+def print_report(report: dict) -> None:
+    lat = report["latency_ms"]
+
+    def fmt(value: Optional[float]) -> str:
+        return "—" if value is None else f"{value:.1f}"
+
+    line = (
+        f"{report['mode']:<8} c={report['concurrency']:<4} "
+        f"ok={report['ok']:<5} err={report['errors']:<4} "
+        f"rps={fmt(report['throughput_rps']):>7}  "
+        f"p50={fmt(lat['p50']):>8}ms p95={fmt(lat['p95']):>8}ms p99={fmt(lat['p99']):>8}ms"
+    )
+    if "ttft_ms" in report:
+        line += f"  ttft p50={fmt(report['ttft_ms']['p50'])}ms p95={fmt(report['ttft_ms']['p95'])}ms"
+    print(line)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Zátěžový test OllamaClient")
+    parser.add_argument("--url", help="Ollama server (bez něj se spustí falešný)")
+    parser.add_argument("--mode", choices=MODES, default="generate")
+    parser.add_argument("--concurrency", default="1,4,8,16", help="Úrovně souběžnosti oddělené čárkou")
+    parser.add_argument("--requests", type=int, default=100, help="Počet dotazů na úroveň")
+    parser.add_argument("--warmup", type=int, default=4, help="Zahřívací dotazy (nezapočítávají se)")
+    parser.add_argument("--max-tokens", type=int, default=30)
+    parser.add_argument("--output", help="Uložit výsledky jako JSON")
+    add_config_arguments(parser)
+    args = parser.parse_args()
+
+    fake = None
+    url = args.url
+    if url is None:
+        fake = FakeOllama(config_from_args(args))
+        url = fake.start()
+        print(f"🦙 Falešná Ollama na {url}")
+
+    reports = []
+    try:
+        for level in (int(c) for c in args.concurrency.split(",") if c.strip()):
+            report = run_level(url, args.mode, level, args.requests, args.max_tokens, args.warmup)
+            print_report(report)
+            reports.append(report)
+    finally:
+        if fake is not None:
+            fake.stop()
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"url": url, "results": reports}, f, indent=2)
+        print(f"✅ Výsledky uloženy do {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,231 @@
+"""
+Měření času horkých cest BaddieOS (úložiště, DataFrame, stránky,
+klasifikace, HTTP volání Ollamy).
+
+- `@timed("db.load")` / `with span("ollama.generate"):` změří úsek.
+- `with rerun("📊 Dashboard"):` ohraničí jeden Streamlit rerun – úseky
+  změřené uvnitř (i ve vláknech spuštěných přes `propagate`) se uloží
+  do jeho trace.
+- Posledních MAX_SAMPLES časů každého úseku slouží pro histogramy,
+  posledních MAX_TRACES rerunů lze exportovat jako Chrome trace
+  (chrome://tracing, https://ui.perfetto.dev).
+- `add_listener(fn)` – fn(název, délka) dostane každé měření (metrics.py).
+
+Vypnuté měření (BADDIEOS_PERF=0 nebo set_enabled(False)) stojí jen
+kontrolu jednoho příznaku na volání.
+"""
+
+import contextlib
+import contextvars
+import functools
+import os
+import threading
+import time
+from collections import deque
+from typing import Callable, Optional
+
+MAX_TRACES = 50      # kolik posledních rerunů se drží
+MAX_SAMPLES = 500    # kolik posledních časů každého úseku se drží
+# Hranice histogramu v ms (poslední koš je "víc než")
+BUCKETS_MS = (0.1, 0.5, 1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+_enabled = os.environ.get("BADDIEOS_PERF", "1") == "1"
+_current: contextvars.ContextVar[Optional["Trace"]] = contextvars.ContextVar(
+    "baddieos_trace", default=None
+)
+_NULL = contextlib.nullcontext()
+
+
+class Trace:
+    """Jeden rerun: název, vlákno, začátek, délka a změřené úseky."""
+
+    __slots__ = ("name", "thread", "start", "wall", "duration", "spans")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.thread = threading.current_thread().name
+        self.start = time.perf_counter()
+        self.wall = time.time()
+        self.duration: Optional[float] = None
+        # (název, začátek, délka, vlákno) – časy v sekundách (perf_counter)
+        self.spans: list[tuple[str, float, float, str]] = []
+
+
+class Recorder:
+    """Omezené úložiště změřených časů a dokončených rerunů."""
+
+    def __init__(self, max_traces: int = MAX_TRACES, max_samples: int = MAX_SAMPLES):
+        self.max_samples = max_samples
+        self.traces: deque = deque(maxlen=max_traces)
+        self.samples: dict[str, deque] = {}
+        self.listeners: list[Callable[[str, float], None]] = []
+        self._lock = threading.Lock()
+
+    def add_listener(self, listener: Callable[[str, float], None]) -> None:
+        """Zaregistruje odběratele každého měření (název, délka v s)."""
+        with self._lock:
+            if listener not in self.listeners:
+                self.listeners.append(listener)
+
+    def record(self, name: str, start: float, duration: float) -> None:
+        trace = _current.get()
+        if trace is not None:
+            trace.spans.append((name, start, duration, threading.current_thread().name))
+        samples = self.samples.get(name)
+        if samples is None:
+            with self._lock:
+                samples = self.samples.setdefault(name, deque(maxlen=self.max_samples))
+        samples.append(duration)
+        for listener in self.listeners:
+            listener(name, duration)
+
+    def finish(self, trace: Trace) -> None:
+        trace.duration = time.perf_counter() - trace.start
+        self.record("rerun", trace.start, trace.duration)
+        self.traces.append(trace)
+
+    def reset(self) -> None:
+        with self._lock:
+            self.traces.clear()
+            self.samples.clear()
+
+    def names(self) -> list[str]:
+        return sorted(self.samples)
+
+    def summary(self) -> list[dict]:
+        """Statistiky každého úseku v ms: počet, p50, p95, max, poslední."""
+        rows = []
+        for name in self.names():
+            values = sorted(self.samples[name])
+            if not values:
+                continue
+            last = self.samples[name][-1]
+            rows.append({
+                "úsek": name,
+                "počet": len(values),
+                "p50 ms": values[len(values) // 2] * 1000,
+                "p95 ms": values[min(len(values) - 1, int(len(values) * 0.95))] * 1000,
+                "max ms": values[-1] * 1000,
+                "poslední ms": last * 1000,
+            })
+        return rows
+
+    def histogram(self, name: str) -> list[tuple[str, int]]:
+        """Počty časů úseku v koších BUCKETS_MS – [(popisek, počet), ...]."""
+        counts = [0] * (len(BUCKETS_MS) + 1)
+        for value in list(self.samples.get(name, ())):
+            ms = value * 1000
+            i = 0
+            while i < len(BUCKETS_MS) and ms > BUCKETS_MS[i]:
+                i += 1
+            counts[i] += 1
+        labels = [f"≤{b:g} ms" for b in BUCKETS_MS] + [f">{BUCKETS_MS[-1]:g} ms"]
+        return list(zip(labels, counts))
+
+    def recent_traces(self) -> list[Trace]:
+        return list(self.traces)
+
+    def chrome_trace(self) -> dict:
+        """Reruny ve formátu Chrome Trace Event (complete events, µs)."""
+        events = []
+        tids: dict[str, int] = {}
+        for trace in list(self.traces):
+            events.append({
+                "name": f"rerun {trace.name}",
+                "ph": "X",
+                "ts": trace.start * 1e6,
+                "dur": (trace.duration or 0) * 1e6,
+                "pid": 1,
+                "tid": tids.setdefault(trace.thread, len(tids)),
+                "args": {"wall": trace.wall},
+            })
+            for name, start, duration, thread in list(trace.spans):
+                events.append({
+                    "name": name,
+                    "ph": "X",
+                    "ts": start * 1e6,
+                    "dur": duration * 1e6,
+                    "pid": 1,
+                    "tid": tids.setdefault(thread, len(tids)),
+                })
+        events.extend(
+            {"name": "thread_name", "ph": "M", "pid": 1, "tid": tid, "args": {"name": thread}}
+            for thread, tid in tids.items()
+        )
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+
+RECORDER = Recorder()
+
+
+class _Span:
+    __slots__ = ("name", "start")
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        RECORDER.record(self.name, self.start, time.perf_counter() - self.start)
+
+
+def add_listener(listener: Callable[[str, float], None]) -> None:
+    RECORDER.add_listener(listener)
+
+
+def enabled() -> bool:
+    return _enabled
+
+
+def set_enabled(flag: bool) -> None:
+    """Zapne/vypne měření pro celý proces."""
+    global _enabled
+    _enabled = flag
+
+
+def span(name: str):
+    """Context manager, který změří blok kódu."""
+    return _Span(name) if _enabled else _NULL
+
+
+def timed(name: Optional[str] = None) -> Callable:
+    """Dekorátor – změří každé volání funkce (výchozí název = jméno funkce)."""
+    def decorator(func: Callable) -> Callable:
+        label = name or func.__name__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                RECORDER.record(label, start, time.perf_counter() - start)
+        return wrapper
+    return decorator
+
+
+@contextlib.contextmanager
+def rerun(name: str):
+    """Ohraničí jeden rerun; úseky změřené uvnitř patří do jeho trace."""
+    if not _enabled:
+        yield None
+        return
+    trace = Trace(name)
+    token = _current.set(trace)
+    try:
+        yield trace
+    finally:
+        _current.reset(token)
+        RECORDER.finish(trace)
+
+
+def propagate(func: Callable) -> Callable:
+    """Obalí funkci pro jiné vlákno tak, aby její úseky patřily do aktuálního rerunu."""
+    if not _enabled or _current.get() is None:
+        return func
+    return functools.partial(contextvars.copy_context().run, func)
@@ -0,0 +1,135 @@
+"""
+Response Assistant – klasifikace zpráv a generování odpovědí persony
+(Ollama s limitem čekání, jinak šablony).
+"""
+
+import random
+import time
+from typing import Callable, Optional
+
+import streamlit as st
+
+import metrics
+import perf
+from classifier import KeywordClassifier
+from llm import LLM_BUDGET, get_ollama, run_with_budget
+from ollama_client import PersonaSession
+from templates import KEYWORD_MAP, RESPONSE_TEMPLATES
+
+
+# Klasifikátor se kompiluje jednou při startu
+CLASSIFIER = KeywordClassifier(KEYWORD_MAP)
+
+
+@perf.timed("classify")
+def classify_message(msg: str) -> str:
+    """Klasifikuje zprávu podle klíčových slov."""
+    category = CLASSIFIER.classify(msg)
+    metrics.CLASSIFICATIONS.inc(category=category)
+    return category
+
+
+@perf.timed("classify.batch")
+def classify_messages(messages: list[str]) -> list[str]:
+    """Klasifikuje dávku zpráv najednou."""
+    categories = CLASSIFIER.classify_many(messages)
+    metrics.record_classifications(categories)
+    return categories
+
+
+RESPONSE_SYSTEM_PROMPT = (
+    "Jsi {name}, digitální influencerka na Amateri.com. {lore}\n"
+    "Odpovídáš fanouškům česky, krátce (1–2 věty), vtipně a s emoji. "
+    "Nikdy neslibuj osobní setkání a vulgarity s humorem odraž."
+)
+
+
+@st.cache_resource(max_entries=4)
+def get_persona_session(persona_name: str, persona_lore: str) -> PersonaSession:
+    """Session persony – system prompt se na serveru prefillne jen jednou."""
+    system_prompt = RESPONSE_SYSTEM_PROMPT.format(name=persona_name, lore=persona_lore)
+    return PersonaSession(get_ollama(), system_prompt, keep_alive="30m")
+
+
+def response_prompt(msg: str, category: str) -> str:
+    """Prompt pro odpověď – zpráva, kategorie a dvě šablony jako příklad stylu."""
+    examples = "\n".join(f"- {t}" for t in RESPONSE_TEMPLATES[category][:2])
+    return (
+        f"Zpráva od fanouška (kategorie: {category}):\n{msg}\n\n"
+        f"Příklady stylu:\n{examples}\n\nTvoje odpověď:"
+    )
+
+
+def generate_response(
+    msg: str,
+    persona_name: str = "BaddieBabe",
+    persona_lore: str = "",
+    use_llm: bool = True,
+    fresh: bool = False,
+    budget: float = LLM_BUDGET,
+) -> dict:
+    """
+    Generuje odpověď na zprávu – přes Ollama, pokud odpoví do `budget` sekund,
+    jinak ze šablon. fresh=True obejde cache odpovědí (nová varianta).
+    Vrátí category, response, source ("ollama"/"šablona"), fallback (důvod) a elapsed_ms.
+    """
+    start = time.perf_counter()
+    category = classify_message(msg)
+    text, fallback = None, "vypnuto"
+    if use_llm:
+        session = get_persona_session(persona_name, persona_lore)
+        prompt = response_prompt(msg, category)
+
+        def call() -> Optional[str]:
+            if session.context is None:
+                session.prefill()
+            return session.generate(prompt, max_tokens=150, bypass_cache=fresh)
+
+        text, fallback = run_with_budget([call], budget)[0]
+    return {
+        "category": category,
+        "response": text or random.choice(RESPONSE_TEMPLATES[category]),
+        "source": "ollama" if text else "šablona",
+        "fallback": fallback,
+        "elapsed_ms": (time.perf_counter() - start) * 1000,
+    }
+
+
+def stream_response(
+    msg: str,
+    on_text: Callable[[str], None],
+    persona_name: str = "BaddieBabe",
+    persona_lore: str = "",
+    budget: float = LLM_BUDGET,
+) -> dict:
+    """
+    Jako generate_response, ale text z Ollamy posílá průběžně do on_text
+    (dosud složený text). Limit `budget` platí pro čekání na první i každý
+    další kousek; když model neodpoví nebo stream spadne, vrátí se šablona.
+    Stream jde mimo cache odpovědí – každé volání je nová varianta.
+    """
+    start = time.perf_counter()
+    category = classify_message(msg)
+    text, fallback = None, "Ollama nedostupná"
+    client = get_ollama()
+    if client.is_available():
+        session = get_persona_session(persona_name, persona_lore)
+        stream = session.generate_stream(
+            response_prompt(msg, category), max_tokens=150, timeout=(client.connect_timeout, budget)
+        )
+        if stream is not None:
+            with stream:
+                for _ in stream:
+                    on_text(stream.text)
+                text = stream.result() or None
+        if text is not None:
+            fallback = None
+        else:
+            fallback = "vypršel limit" if time.perf_counter() - start >= budget else "chyba modelu"
+    return {
+        "category": category,
+        "response": text or random.choice(RESPONSE_TEMPLATES[category]),
+        "source": "ollama" if text else "šablona",
+        "fallback": fallback,
+        "elapsed_ms": (time.perf_counter() - start) * 1000,
+    }
@@ -0,0 +1,133 @@
+"""
+Vyhledávací index nicknamů pro CRM.
+Udržuje se inkrementálně z write path úložiště (FanStorage.add_observer).
+
+- Nicknamy se porovnávají bez ohledu na velikost písmen a diakritiku
+  ("Šárka" najde i "sar").
+- Dotazy kratší než 3 znaky = podřetězec lineárním průchodem přes
+  normalizované nicknamy (trigram z nich nejde sestavit),
+  delší = podřetězec (průnik trigramového inverzního indexu + ověření).
+- prefix() hledá začátky nicknamů (bisect nad seřazeným polem).
+"""
+
+import bisect
+import threading
+import unicodedata
+from typing import Optional
+
+from storage import nickname_key
+
+
+def fold(text: str) -> str:
+    """Normalizuje text pro hledání: casefold + odstranění diakritiky."""
+    decomposed = unicodedata.normalize("NFKD", text.casefold())
+    return "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+
+
+def trigrams(text: str) -> set[str]:
+    """Množina trigramů textu."""
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+class NicknameIndex:
+    """Seřazené pole pro prefixy + trigramový index pro podřetězce."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._folded: dict[str, str] = {}
+        self._sorted: list[tuple[str, str]] = []
+        self._postings: dict[str, set[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._folded)
+
+    def _add(self, fan: dict) -> None:
+        key = nickname_key(fan["nickname"])
+        if key in self._folded:
+            self._remove(key)
+        folded = fold(fan["nickname"].strip())
+        self._folded[key] = folded
+        bisect.insort(self._sorted, (folded, key))
+        for gram in trigrams(folded):
+            self._postings.setdefault(gram, set()).add(key)
+
+    def _remove(self, key: str) -> None:
+        folded = self._folded.pop(key, None)
+        if folded is None:
+            return
+        pos = bisect.bisect_left(self._sorted, (folded, key))
+        if pos < len(self._sorted) and self._sorted[pos] == (folded, key):
+            del self._sorted[pos]
+        for gram in trigrams(folded):
+            keys = self._postings.get(gram)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._postings[gram]
+
+    # --- rozhraní pozorovatele úložiště ---
+
+    def reset(self, fans: list[dict]) -> None:
+        with self._lock:
+            self._folded = {}
+            self._postings = {}
+            self._sorted = []
+            for fan in fans:
+                key = nickname_key(fan["nickname"])
+                folded = fold(fan["nickname"].strip())
+                self._folded[key] = folded
+                for gram in trigrams(folded):
+                    self._postings.setdefault(gram, set()).add(key)
+            self._sorted = sorted((folded, key) for key, folded in self._folded.items())
+
+    def on_insert(self, fan: dict) -> None:
+        with self._lock:
+            self._add(fan)
+
+    def on_delete(self, fan: dict) -> None:
+        with self._lock:
+            self._remove(nickname_key(fan["nickname"]))
+
+    # --- dotazy ---
+
+    def prefix(self, query: str) -> set[str]:
+        """Klíče nicknamů začínajících dotazem."""
+        q = fold(query.strip())
+        with self._lock:
+            start = bisect.bisect_left(self._sorted, (q,))
+            end = bisect.bisect_left(self._sorted, (q + "\U0010ffff",), start)
+            return {key for _, key in self._sorted[start:end]}
+
+    def scan(self, query: str) -> set[str]:
+        """Klíče nicknamů obsahujících dotaz – lineární průchod (pro krátké dotazy)."""
+        q = fold(query.strip())
+        with self._lock:
+            return {key for key, folded in self._folded.items() if q in folded}
+
+    def substring(self, query: str) -> set[str]:
+        """Klíče nicknamů obsahujících dotaz (dotaz alespoň 3 znaky)."""
+        q = fold(query.strip())
+        grams = trigrams(q)
+        with self._lock:
+            postings = [self._postings.get(g) for g in grams]
+            if not postings or any(p is None for p in postings):
+                return set()
+            postings.sort(key=len)
+            candidates = set(postings[0])
+            for p in postings[1:]:
+                candidates &= p
+                if not candidates:
+                    return set()
+            return {key for key in candidates if q in self._folded[key]}
+
+    def search(self, query: str) -> Optional[set[str]]:
+        """
+        Klíče (nickname_key) odpovídající dotazu.
+        Vrátí None pro prázdný dotaz (= nefiltrovat).
+        """
+        q = fold(query.strip())
+        if not q:
+            return None
+        if len(q) < 3:
+            return self.scan(q)
+        return self.substring(q)
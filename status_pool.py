@@ -0,0 +1,151 @@
+"""
+Zásobník předpřipravených statusů pro Status Generator.
+Pro každé období (ráno, odpoledne, večer, náhodný) drží pár hotových
+statusů, takže kliknutí na "Generovat" vrací hned a na model se nečeká.
+
+- Vlákno na pozadí doplňuje zásobník z `producer` (např. Ollama) – jen
+  pro období, o která už někdo požádal (take/warm), ať se zbytečně
+  negeneruje.
+- Statusy se neopakují: nový kandidát se zahodí, pokud je v zásobníku
+  nebo mezi posledními zobrazenými (recent_size).
+- Když zásobník nestačí, doplní se status ze šablon – ze šablon se
+  přednostně berou ty, které se nezobrazily nejdéle.
+"""
+
+import random
+import threading
+import time
+from collections import deque
+from typing import Callable, Optional
+
+
+def _norm(text: str) -> str:
+    return " ".join(text.casefold().split())
+
+
+class StatusPool:
+    """Omezený zásobník statusů pro každé období s doplňováním na pozadí."""
+
+    def __init__(
+        self,
+        templates: dict[str, list[str]],
+        producer: Optional[Callable[[str], Optional[str]]] = None,
+        capacity: int = 5,
+        recent_size: int = 20,
+        retry_delay: float = 5.0,
+    ):
+        self.templates = templates
+        self.producer = producer
+        self.capacity = capacity
+        self.retry_delay = retry_delay
+        self._ready: dict[str, deque] = {p: deque() for p in templates}
+        self._recent: dict[str, deque] = {p: deque(maxlen=recent_size) for p in templates}
+        self._active: set[str] = set()
+        self._cond = threading.Condition()
+        self._stopped = False
+        self._thread: Optional[threading.Thread] = None
+
+    def __len__(self) -> int:
+        with self._cond:
+            return sum(len(items) for items in self._ready.values())
+
+    def ready_count(self, period: str) -> int:
+        """Počet hotových statusů pro období."""
+        with self._cond:
+            return len(self._ready[period])
+
+    # --- interní (volat se zámkem) ---
+
+    def _seen(self, period: str, text: str) -> bool:
+        key = _norm(text)
+        return key in self._recent[period] or any(
+            _norm(item["text"]) == key for item in self._ready[period]
+        )
+
+    def _template_item(self, period: str) -> dict:
+        templates = self.templates[period]
+        fresh = [t for t in templates if not self._seen(period, t)]
+        if fresh:
+            text = random.choice(fresh)
+        else:
+            # Všechny šablony byly nedávno – vezmi tu zobrazenou nejdéle
+            last_shown = {key: i for i, key in enumerate(self._recent[period])}
+            text = min(templates, key=lambda t: last_shown.get(_norm(t), -1))
+        return {"text": text, "source": "šablona"}
+
+    def _next_period(self) -> Optional[str]:
+        for period in self._active:
+            if len(self._ready[period]) < self.capacity:
+                return period
+        return None
+
+    def _ensure_thread(self) -> None:
+        if self.producer is None or self._thread is not None:
+            return
+        self._thread = threading.Thread(
+            target=self._refill_loop, name="baddieos-status-pool", daemon=True
+        )
+        self._thread.start()
+
+    def _refill_loop(self) -> None:
+        while True:
+            with self._cond:
+                period = self._next_period()
+                while not self._stopped and period is None:
+                    self._cond.wait()
+                    period = self._next_period()
+                if self._stopped:
+                    return
+            try:
+                text = self.producer(period)
+            except Exception:
+                text = None
+            text = (text or "").strip()
+            with self._cond:
+                if text and not self._seen(period, text):
+                    self._ready[period].append({"text": text, "source": "ollama"})
+                    self._cond.notify_all()
+                    continue
+                # Model neodpověděl nebo vrátil duplicitu – chvíli počkej
+                self._cond.wait(self.retry_delay)
+
+    # --- veřejné rozhraní ---
+
+    def warm(self, period: str) -> None:
+        """Začne doplňovat zásobník pro období (např. při otevření stránky)."""
+        with self._cond:
+            self._active.add(period)
+            self._ensure_thread()
+            self._cond.notify_all()
+
+    def take(self, period: str, count: int = 1, timeout: float = 0.0) -> list[dict]:
+        """
+        Vydá `count` statusů ({"text", "source"}). Počká nejvýš `timeout`
+        sekund na doplnění zásobníku, chybějící statusy doplní ze šablon.
+        """
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            self._active.add(period)
+            self._ensure_thread()
+            self._cond.notify_all()
+            if self.producer is not None:
+                while len(self._ready[period]) < count:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+
+            items = []
+            ready = self._ready[period]
+            while len(items) < count:
+                item = ready.popleft() if ready else self._template_item(period)
+                self._recent[period].append(_norm(item["text"]))
+                items.append(item)
+            self._cond.notify_all()
+            return items
+
+    def stop(self) -> None:
+        """Zastaví doplňovací vlákno."""
+        with self._cond:
+            self._stopped = True
+            self._cond.notify_all()
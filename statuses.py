@@ -0,0 +1,89 @@
+"""
+Status Generator – denní období a statusy ze zásobníku (StatusPool),
+který na pozadí doplňuje Ollama; co nestihne, doplní šablona.
+"""
+
+import time
+from datetime import datetime
+from typing import Optional
+
+import streamlit as st
+
+import metrics
+from llm import LLM_BUDGET, get_ollama
+from status_pool import StatusPool
+from templates import STATUS_TEMPLATES
+
+
+def get_auto_period() -> str:
+    """Automaticky určí denní období podle aktuálního času."""
+    hour = datetime.now().hour
+    if 5 <= hour < 12:
+        return "ráno"
+    elif 12 <= hour < 18:
+        return "odpoledne"
+    elif 18 <= hour < 23:
+        return "večer"
+    else:
+        return "náhodný"
+
+
+STATUS_SYSTEM_PROMPT = (
+    "Jsi sebevědomá digitální influencerka a píšeš statusy na sociální síť – "
+    "česky, 1–2 věty, s emoji, bez hashtagů. Vrať jen text statusu."
+)
+
+
+def llm_status(period: str) -> Optional[str]:
+    """Jeden nový status z Ollamy (producent pro StatusPool)."""
+    examples = "\n".join(f"- {t}" for t in STATUS_TEMPLATES[period])
+    prompt = f"Napiš jeden nový status pro období „{period}“. Inspiruj se stylem, ale neopakuj:\n{examples}"
+    # Každý status má být jiný – cache odpovědí se obchází
+    return get_ollama().generate(STATUS_SYSTEM_PROMPT, prompt, max_tokens=100, bypass_cache=True)
+
+
+@st.cache_resource
+def get_status_pool(use_llm: bool) -> StatusPool:
+    """Sdílený zásobník statusů – s Ollamou se doplňuje na pozadí."""
+    return StatusPool(STATUS_TEMPLATES, producer=llm_status if use_llm else None)
+
+
+def generate_statuses(
+    period: str = "auto",
+    count: int = 1,
+    use_llm: bool = True,
+    budget: float = LLM_BUDGET,
+) -> list[dict]:
+    """
+    Vydá `count` statusů ze zásobníku (StatusPool). S Ollamou počká na
+    doplnění nejvýš `budget` sekund, co chybí, doplní šablona.
+    Každý status: text, source ("ollama"/"šablona"), fallback (důvod) a elapsed_ms.
+    """
+    start = time.perf_counter()
+    if period == "auto":
+        period = get_auto_period()
+    if period not in STATUS_TEMPLATES:
+        period = "náhodný"
+    fallback = "vypnuto"
+    if use_llm and not get_ollama().is_available():
+        use_llm, fallback = False, "Ollama nedostupná"
+    elif use_llm:
+        fallback = "vypršel limit"
+    items = get_status_pool(use_llm).take(period, count, timeout=budget if use_llm else 0.0)
+    if use_llm:
+        for item in items:
+            metrics.record_cache("status_pool", item["source"] == "ollama")
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    return [
+        {
+            **item,
+            "fallback": None if item["source"] == "ollama" else fallback,
+            "elapsed_ms": elapsed_ms,
+        }
+        for item in items
+    ]
+
+
+def generate_status(period: str = "auto", use_llm: bool = True, budget: float = LLM_BUDGET) -> dict:
+    """Vygeneruje jeden status pro zvolené období (viz generate_statuses)."""
+    return generate_statuses(period, 1, use_llm, budget)[0]
@@ -0,0 +1,733 @@
+"""
+Úložiště fanoušků pro BaddieOS.
+Dva backendy se stejným rozhraním (FanStorage):
+- SqliteStorage: SQLite ve WAL režimu s indexy – přidání/smazání fanouška
+  změní jeden řádek místo přepsání celé databáze.
+- JsonStorage: původní formát fans_db.json (fallback, bez závislostí)
+  s append-only žurnálem změn vedle snapshotu.
+Zápisy obou backendů se měří (perf.py úseky db.save/insert/update/delete).
+
+Jednorázová migrace:
+    python storage.py migrate fans_db.json fans_db.sqlite3
+"""
+
+import argparse
+import contextlib
+import heapq
+import itertools
+import json
+import os
+import sqlite3
+import threading
+from typing import Iterator, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows – bez meziprocesového zámku
+    fcntl = None
+
+import perf
+
+
+JSON_FILE = "fans_db.json"
+SQLITE_FILE = "fans_db.sqlite3"
+DB_COLUMNS = ["nickname", "tier", "total_support", "notes", "migrate_telegram", "created"]
+TIERS = ["Free", "Supporter", "VIP"]
+
+_instance_ids = itertools.count(1)
+
+
+def nickname_key(nickname: str) -> str:
+    """Normalizovaný klíč nicknamu pro case-insensitive porovnání."""
+    return nickname.strip().casefold()
+
+
+class FanStorage:
+    """Společné rozhraní backendů úložiště fanoušků."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.RLock()
+        # Čítač zápisů – mění se jen když se data opravdu změní
+        self._version = 0
+        self._instance = next(_instance_ids)
+        # Odvozené struktury (agregace, indexy) udržované z write path
+        self._observers: list = []
+        self._observed_version = 0
+        self._observed_data_version = None
+        self._notifying = False
+
+    def _data_version(self):
+        """Verze dat změněná mimo tuto instanci (jiný proces). None = nesleduje se."""
+        return None
+
+    def version(self) -> tuple:
+        """Token verze dat – klíč pro cache odvozených struktur (DataFrame apod.)."""
+        return (self._instance, self._version, self._data_version())
+
+    # --- pozorovatelé write path ---
+
+    def add_observer(self, observer) -> None:
+        """
+        Zaregistruje odvozenou strukturu s metodami reset(fans),
+        on_insert(fan) a on_delete(fan). Ta se pak udržuje inkrementálně
+        při každém zápisu místo přepočtu z celé databáze.
+        """
+        with self._lock:
+            observer.reset(self.load_all())
+            self._observers.append(observer)
+            self._observed_version = self._version
+            self._observed_data_version = self._data_version()
+
+    def sync_observers(self) -> None:
+        """Přebuduje pozorovatele, pokud data změnil někdo mimo tuto instanci."""
+        with self._lock:
+            if not self._observers:
+                return
+            if (self._version, self._data_version()) != (
+                self._observed_version, self._observed_data_version
+            ):
+                self._reset_observers()
+
+    def _reset_observers(self) -> None:
+        if self._observers:
+            fans = self.load_all()
+            for observer in self._observers:
+                observer.reset(fans)
+        self._observed_version = self._version
+        self._observed_data_version = self._data_version()
+
+    def _notify(self, removed: Optional[dict] = None, added: Optional[dict] = None) -> None:
+        # Pozorovatel může během notifikace číst z úložiště (doplnění top-K) –
+        # přebudování pozorovatelů se tehdy odloží na příští sync_observers()
+        self._notifying = True
+        try:
+            for observer in self._observers:
+                if removed is not None:
+                    observer.on_delete(dict(removed))
+                if added is not None:
+                    observer.on_insert(dict(added))
+        finally:
+            self._notifying = False
+        self._observed_version = self._version
+
+    def top_fans(self, k: int) -> list[dict]:
+        """k fanoušků s nejvyšší podporou."""
+        return heapq.nlargest(k, self.load_all(), key=lambda f: f.get("total_support", 0))
+
+    def load_all(self) -> list[dict]:
+        """Vrátí všechny fanoušky."""
+        raise NotImplementedError
+
+    def save_all(self, fans: list[dict]) -> None:
+        """Nahradí celou databázi zadaným seznamem."""
+        raise NotImplementedError
+
+    def get_fan(self, nickname: str) -> Optional[dict]:
+        """Najde fanouška podle nicknamu (bez ohledu na velikost písmen)."""
+        raise NotImplementedError
+
+    def insert_fan(self, fan: dict) -> bool:
+        """
+        Atomicky přidá fanouška, pokud nickname ještě neexistuje.
+        Vrátí False pro duplicitu (bez ohledu na velikost písmen).
+        """
+        raise NotImplementedError
+
+    def insert_many(self, fans: list[dict]) -> int:
+        """Vloží dávku fanoušků (duplicity přeskočí). Vrátí počet vložených."""
+        return sum(self.insert_fan(fan) for fan in fans)
+
+    def iter_fans(self, batch_size: int = 1000) -> Iterator[list[dict]]:
+        """Postupně vrací fanoušky po dávkách (pro export bez načtení všeho)."""
+        fans = self.load_all()
+        for start in range(0, len(fans), batch_size):
+            yield fans[start:start + batch_size]
+
+    def update_fan(self, nickname: str, changes: dict) -> bool:
+        """
+        Upraví fanouška. Vrátí False, pokud neexistuje nebo by přejmenování
+        kolidovalo s jiným existujícím nicknamem.
+        """
+        raise NotImplementedError
+
+    def delete_fan(self, nickname: str) -> bool:
+        """Smaže fanouška. Vrátí False, pokud neexistuje."""
+        raise NotImplementedError
+
+    def count(self) -> int:
+        """Počet fanoušků v databázi."""
+        return len(self.load_all())
+
+    def close(self) -> None:
+        """Uvolní zdroje backendu."""
+
+
+# ============================================================================
+# JSON BACKEND (FALLBACK)
+# ============================================================================
+
+class JsonStorage(FanStorage):
+    """
+    JSON snapshot (fans_db.json) + append-only žurnál (fans_db.json.journal).
+
+    Každá změna je jeden JSON řádek připsaný do žurnálu – O(1) místo přepsání
+    celého souboru. Při startu se snapshot načte a žurnál se přehraje; po
+    `compact_every` záznamech se stav zapíše do nového snapshotu (atomicky
+    přes dočasný soubor + os.replace) a žurnál se vyprázdní.
+
+    Přehrání je idempotentní (insert = upsert, delete chybějícího = no-op),
+    takže pád mezi zápisem snapshotu a vyprázdněním žurnálu nic nerozbije.
+    Useknutý poslední řádek žurnálu (pád uprostřed zápisu) se zahodí.
+
+    Zápisy jiného procesu (fan_io.py import, ruční úprava souboru) se poznají
+    podle stavu souborů (inode, mtime, velikost snapshotu i žurnálu) – před
+    každým čtením a zápisem se v takovém případě data znovu načtou z disku.
+    Zápis (kontrola → připsání do žurnálu → kompakce) drží meziprocesový
+    zámek fcntl.flock na <db>.lock, takže se mezi nimi nevklíní zápis jiné
+    instance a kompakce nepřepíše cizí změny starým stavem z paměti.
+    Na Windows (bez fcntl) chrání zápis jen zámek vláken v rámci procesu.
+    """
+
+    def __init__(self, path: str = JSON_FILE, compact_every: int = 500, fsync: bool = True):
+        super().__init__(path)
+        self.journal_path = path + ".journal"
+        self.lock_path = path + ".lock"
+        self.compact_every = compact_every
+        self.fsync = fsync
+        self._fans: dict[str, dict] = {}
+        self._journal_records = 0
+        # Stav souborů po posledním vlastním načtení/zápisu a čítač cizích změn
+        self._disk_state = None
+        self._external_version = 0
+        self._flock_depth = 0
+        with self._locked():
+            self._load()
+
+    @contextlib.contextmanager
+    def _locked(self):
+        """Zámek vláken + meziprocesový zámek souboru (reentrantní v rámci instance)."""
+        with self._lock:
+            lock_file = None
+            if fcntl is not None and not self._flock_depth:
+                lock_file = open(self.lock_path, "a")
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            self._flock_depth += 1
+            try:
+                yield
+            finally:
+                self._flock_depth -= 1
+                if lock_file is not None:
+                    # Zavřením souboru se flock uvolní
+                    lock_file.close()
+
+    # --- načtení & přehrání ---
+
+    def _load(self, repair: bool = True) -> bool:
+        state = self._file_state()
+        snapshot = self._read_snapshot(repair)
+        if snapshot is None:
+            return False
+        self._fans = {}
+        for fan in snapshot:
+            self._fans[nickname_key(fan["nickname"])] = fan
+        self._journal_records = self._replay_journal(repair)
+        self._disk_state = state
+        return True
+
+    @staticmethod
+    def _stat(path: str) -> Optional[tuple]:
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            return None
+        return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+    def _file_state(self) -> tuple:
+        return (self._stat(self.path), self._stat(self.journal_path))
+
+    def _refresh(self) -> None:
+        """Znovu načte data, pokud snapshot nebo žurnál změnil jiný proces."""
+        if self._file_state() == self._disk_state:
+            return
+        with self._locked():
+            if self._file_state() == self._disk_state:
+                return
+            # Ruční úprava souboru zámek nedrží – useknutý řádek se neodřízne,
+            # jen přeskočí (po dopsání se soubor změní a načte znovu)
+            if not self._load(repair=False):
+                # Rozepsaný/poškozený snapshot – zůstane stav v paměti, zkusí se příště
+                return
+            self._external_version += 1
+            if not self._notifying:
+                self._reset_observers()
+
+    def _data_version(self):
+        with self._lock:
+            self._refresh()
+            return self._external_version
+
+    def _read_snapshot(self, repair: bool = True) -> Optional[list[dict]]:
+        if not os.path.exists(self.path):
+            return []
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (json.JSONDecodeError, IOError):
+            if not repair:
+                return None
+            # Poškozený snapshot nepřepisujeme – odložíme ho pro ruční obnovu
+            os.replace(self.path, self.path + ".corrupt")
+            return []
+
+    def _replay_journal(self, repair: bool = True) -> int:
+        if not os.path.exists(self.journal_path):
+            return 0
+        applied = 0
+        valid_bytes = 0
+        torn_tail = False
+        with open(self.journal_path, "rb") as f:
+            for line in f:
+                torn_tail = False
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    torn_tail = True
+                    continue
+                if not line.endswith(b"\n"):
+                    torn_tail = True
+                    continue
+                self._apply(record)
+                applied += 1
+                valid_bytes = f.tell()
+        if torn_tail and repair:
+            # Pád uprostřed zápisu – useknutý poslední řádek odřízneme
+            with open(self.journal_path, "r+b") as f:
+                f.truncate(valid_bytes)
+        return applied
+
+    def _apply(self, record: dict) -> None:
+        op = record["op"]
+        if op == "insert":
+            fan = record["fan"]
+            self._fans[nickname_key(fan["nickname"])] = fan
+        elif op == "update":
+            key = nickname_key(record["nickname"])
+            fan = self._fans.get(key)
+            if fan is None:
+                return
+            changes = record["changes"]
+            new_key = nickname_key(changes.get("nickname", fan["nickname"]))
+            if new_key != key and new_key in self._fans:
+                # Přejmenování na existující nickname by jednoho fanouška smazalo
+                return
+            fan.update(changes)
+            if new_key != key:
+                self._fans = {
+                    (new_key if k == key else k): v for k, v in self._fans.items()
+                }
+        elif op == "delete":
+            self._fans.pop(nickname_key(record["nickname"]), None)
+
+    # --- zápis ---
+
+    def _append(self, *records: dict) -> None:
+        # Volající drží zámek a po _refresh() zkontroloval, že zápis dává smysl
+        lines = "".join(json.dumps(r, ensure_ascii=False) + "\n" for r in records)
+        with open(self.journal_path, "a", encoding="utf-8") as f:
+            f.write(lines)
+            f.flush()
+            if self.fsync:
+                os.fsync(f.fileno())
+        for record in records:
+            self._apply(record)
+        self._disk_state = self._file_state()
+        self._version += 1
+        self._journal_records += len(records)
+        # Snapshot se přepisuje nejdřív po tolika záznamech, kolik má fanoušků
+        # → i hromadný import zůstane amortizovaně O(1) na záznam
+        if self._journal_records >= max(self.compact_every, len(self._fans)):
+            self._compact()
+
+    def _write_snapshot(self, fans: list[dict]) -> None:
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(fans, f, ensure_ascii=False, indent=2)
+            f.flush()
+            if self.fsync:
+                os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+
+    def _compact(self) -> None:
+        self._write_snapshot(list(self._fans.values()))
+        if os.path.exists(self.journal_path):
+            os.remove(self.journal_path)
+        self._journal_records = 0
+        self._disk_state = self._file_state()
+
+    def compact(self) -> None:
+        """Zapíše aktuální stav do nového snapshotu a vyprázdní žurnál."""
+        with self._locked():
+            self._refresh()
+            self._compact()
+
+    # --- FanStorage API ---
+
+    def load_all(self) -> list[dict]:
+        with self._lock:
+            self._refresh()
+            return [dict(f) for f in self._fans.values()]
+
+    @perf.timed("db.save")
+    def save_all(self, fans: list[dict]) -> None:
+        with self._locked():
+            self._fans = {}
+            for fan in fans:
+                self._fans.setdefault(nickname_key(fan["nickname"]), dict(fan))
+            self._version += 1
+            self._compact()
+            self._reset_observers()
+
+    def get_fan(self, nickname: str) -> Optional[dict]:
+        with self._lock:
+            self._refresh()
+            fan = self._fans.get(nickname_key(nickname))
+            return dict(fan) if fan else None
+
+    @perf.timed("db.insert")
+    def insert_fan(self, fan: dict) -> bool:
+        with self._locked():
+            self._refresh()
+            # self._fans je hash mapa podle nickname_key → kontrola duplicity v O(1)
+            if nickname_key(fan["nickname"]) in self._fans:
+                return False
+            self._append({"op": "insert", "fan": dict(fan)})
+            self._notify(added=fan)
+            return True
+
+    @perf.timed("db.insert_many")
+    def insert_many(self, fans: list[dict]) -> int:
+        with self._locked():
+            self._refresh()
+            batch: dict[str, dict] = {}
+            for fan in fans:
+                key = nickname_key(fan["nickname"])
+                if key not in self._fans and key not in batch:
+                    batch[key] = dict(fan)
+            if not batch:
+                return 0
+            self._append(*({"op": "insert", "fan": fan} for fan in batch.values()))
+            for fan in batch.values():
+                self._notify(added=fan)
+            return len(batch)
+
+    @perf.timed("db.update")
+    def update_fan(self, nickname: str, changes: dict) -> bool:
+        with self._locked():
+            self._refresh()
+            key = nickname_key(nickname)
+            old = self._fans.get(key)
+            if old is None:
+                return False
+            if "nickname" in changes:
+                new_key = nickname_key(changes["nickname"])
+                if new_key != key and new_key in self._fans:
+                    return False
+            old = dict(old)
+            self._append({"op": "update", "nickname": nickname, "changes": dict(changes)})
+            self._notify(removed=old, added={**old, **changes})
+            return True
+
+    @perf.timed("db.delete")
+    def delete_fan(self, nickname: str) -> bool:
+        with self._locked():
+            self._refresh()
+            old = self._fans.get(nickname_key(nickname))
+            if old is None:
+                return False
+            self._append({"op": "delete", "nickname": nickname})
+            self._notify(removed=old)
+            return True
+
+    def top_fans(self, k: int) -> list[dict]:
+        with self._lock:
+            self._refresh()
+            top = heapq.nlargest(k, self._fans.values(), key=lambda f: f.get("total_support", 0))
+            return [dict(f) for f in top]
+
+    def count(self) -> int:
+        with self._lock:
+            self._refresh()
+            return len(self._fans)
+
+    def close(self) -> None:
+        with self._locked():
+            self._refresh()
+            if self._journal_records:
+                self._compact()
+
+
+# ============================================================================
+# SQLITE BACKEND
+# ============================================================================
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS fans (
+    id INTEGER PRIMARY KEY,
+    nickname TEXT NOT NULL,
+    nickname_key TEXT NOT NULL,
+    tier TEXT NOT NULL,
+    total_support INTEGER NOT NULL DEFAULT 0,
+    notes TEXT NOT NULL DEFAULT '',
+    migrate_telegram INTEGER NOT NULL DEFAULT 0,
+    created TEXT NOT NULL DEFAULT ''
+);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_fans_nickname_key ON fans(nickname_key);
+CREATE INDEX IF NOT EXISTS idx_fans_tier ON fans(tier);
+CREATE INDEX IF NOT EXISTS idx_fans_total_support ON fans(total_support);
+"""
+
+_FIELDS = "nickname, tier, total_support, notes, migrate_telegram, created"
+_SELECT = f"SELECT {_FIELDS} FROM fans"
+_INSERT = (
+    "INSERT OR IGNORE INTO fans "
+    "(nickname, nickname_key, tier, total_support, notes, migrate_telegram, created) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?)"
+)
+
+
+def _row_to_fan(row: tuple) -> dict:
+    fan = dict(zip(DB_COLUMNS, row))
+    fan["migrate_telegram"] = bool(fan["migrate_telegram"])
+    return fan
+
+
+def _fan_values(fan: dict) -> tuple:
+    """Hodnoty sloupců DB_COLUMNS s výchozími hodnotami podle schématu."""
+    return (
+        fan["nickname"],
+        fan.get("tier", "Free"),
+        fan.get("total_support", 0),
+        fan.get("notes", ""),
+        int(bool(fan.get("migrate_telegram", False))),
+        fan.get("created", ""),
+    )
+
+
+def _fan_to_row(fan: dict) -> tuple:
+    values = _fan_values(fan)
+    return (values[0], nickname_key(values[0]), *values[1:])
+
+
+class SqliteStorage(FanStorage):
+    """
+    SQLite ve WAL režimu.
+    Indexy: unikátní nickname_key (casefold – funguje i pro česká písmena
+    s diakritikou, na rozdíl od COLLATE NOCASE), tier a total_support.
+    """
+
+    def __init__(self, path: str = SQLITE_FILE):
+        super().__init__(path)
+        # Streamlit obsluhuje každou session v jiném vlákně – spojení je
+        # sdílené a chráněné zámkem.
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    def load_all(self) -> list[dict]:
+        with self._lock:
+            rows = self._conn.execute(f"{_SELECT} ORDER BY id").fetchall()
+        return [_row_to_fan(r) for r in rows]
+
+    @perf.timed("db.save")
+    def save_all(self, fans: list[dict]) -> None:
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.execute("DELETE FROM fans")
+                self._conn.executemany(_INSERT, (_fan_to_row(f) for f in fans))
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+            self._version += 1
+            self._reset_observers()
+
+    def get_fan(self, nickname: str) -> Optional[dict]:
+        with self._lock:
+            row = self._conn.execute(
+                f"{_SELECT} WHERE nickname_key = ?", (nickname_key(nickname),)
+            ).fetchone()
+        return _row_to_fan(row) if row else None
+
+    @perf.timed("db.insert")
+    def insert_fan(self, fan: dict) -> bool:
+        with self._lock:
+            # Unikátní index na nickname_key: INSERT OR IGNORE = check-and-insert
+            cur = self._conn.execute(_INSERT, _fan_to_row(fan))
+            if cur.rowcount == 0:
+                return False
+            self._version += 1
+            self._notify(added=_row_to_fan(_fan_values(fan)))
+            return True
+
+    @perf.timed("db.update")
+    def update_fan(self, nickname: str, changes: dict) -> bool:
+        columns = [c for c in DB_COLUMNS if c in changes]
+        if not columns:
+            return self.get_fan(nickname) is not None
+        values = [changes[c] for c in columns]
+        assignments = [f"{c} = ?" for c in columns]
+        if "nickname" in changes:
+            assignments.append("nickname_key = ?")
+            values.append(nickname_key(changes["nickname"]))
+        if "migrate_telegram" in changes:
+            values[columns.index("migrate_telegram")] = int(bool(changes["migrate_telegram"]))
+        with self._lock:
+            old = self.get_fan(nickname)
+            if old is None:
+                return False
+            try:
+                self._conn.execute(
+                    f"UPDATE fans SET {', '.join(assignments)} WHERE nickname_key = ?",
+                    (*values, nickname_key(nickname)),
+                )
+            except sqlite3.IntegrityError:
+                # Unikátní index na nickname_key – přejmenování na existující nickname
+                return False
+            self._version += 1
+            self._notify(removed=old, added=_row_to_fan(_fan_values({**old, **changes})))
+        return True
+
+    @perf.timed("db.delete")
+    def delete_fan(self, nickname: str) -> bool:
+        with self._lock:
+            old = self.get_fan(nickname)
+            if old is None:
+                return False
+            self._conn.execute(
+                "DELETE FROM fans WHERE nickname_key = ?", (nickname_key(nickname),)
+            )
+            self._version += 1
+            self._notify(removed=old)
+        return True
+
+    @perf.timed("db.insert_many")
+    def insert_many(self, fans: list[dict]) -> int:
+        inserted = []
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                for fan in fans:
+                    if self._conn.execute(_INSERT, _fan_to_row(fan)).rowcount:
+                        inserted.append(fan)
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+            if inserted:
+                self._version += 1
+                for fan in inserted:
+                    self._notify(added=_row_to_fan(_fan_values(fan)))
+        return len(inserted)
+
+    def iter_fans(self, batch_size: int = 1000) -> Iterator[list[dict]]:
+        # Keyset stránkování podle id – zámek se drží jen po dobu jedné dávky
+        last_id = 0
+        while True:
+            with self._lock:
+                rows = self._conn.execute(
+                    f"SELECT id, {_FIELDS} FROM fans WHERE id > ? ORDER BY id LIMIT ?",
+                    (last_id, batch_size),
+                ).fetchall()
+            if not rows:
+                return
+            last_id = rows[-1][0]
+            yield [_row_to_fan(r[1:]) for r in rows]
+
+    def top_fans(self, k: int) -> list[dict]:
+        with self._lock:
+            rows = self._conn.execute(
+                f"{_SELECT} ORDER BY total_support DESC, id LIMIT ?", (k,)
+            ).fetchall()
+        return [_row_to_fan(r) for r in rows]
+
+    def _data_version(self):
+        # data_version se změní po commitu z jiného spojení (např. migrace)
+        with self._lock:
+            return self._conn.execute("PRAGMA data_version").fetchone()[0]
+
+    def count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM fans").fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+# ============================================================================
+# VÝBĚR BACKENDU & MIGRACE
+# ============================================================================
+
+def storage_for_path(path: str) -> FanStorage:
+    """Vybere backend podle přípony souboru (.json → JSON, jinak SQLite)."""
+    if path.lower().endswith(".json"):
+        return JsonStorage(path)
+    return SqliteStorage(path)
+
+
+def migrate(source: FanStorage, target: FanStorage) -> int:
+    """Zkopíruje všechny fanoušky ze source do target. Vrátí počet v cíli."""
+    target.save_all(source.load_all())
+    return target.count()
+
+
+def open_storage(
+    backend: str = "sqlite",
+    json_path: str = JSON_FILE,
+    sqlite_path: str = SQLITE_FILE,
+) -> FanStorage:
+    """
+    Otevře úložiště zvoleného backendu ("sqlite" nebo "json").
+    Při prvním otevření SQLite se automaticky převezmou data z JSON souboru.
+    """
+    if backend == "json":
+        return JsonStorage(json_path)
+    if backend == "sqlite":
+        fresh = not os.path.exists(sqlite_path)
+        storage = SqliteStorage(sqlite_path)
+        if fresh and os.path.exists(json_path):
+            migrate(JsonStorage(json_path), storage)
+        return storage
+    raise ValueError(f"Neznámý backend úložiště: {backend}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Správa úložiště fanoušků BaddieOS")
+    sub = parser.add_subparsers(dest="command", required=True)
+    p_migrate = sub.add_parser("migrate", help="Převede databázi mezi backendy (JSON ↔ SQLite)")
+    p_migrate.add_argument("source", help="Zdroj, např. fans_db.json")
+    p_migrate.add_argument("target", help="Cíl, např. fans_db.sqlite3")
+    p_migrate.add_argument("--force", action="store_true", help="Přepsat neprázdný cíl")
+    args = parser.parse_args()
+
+    if args.command == "migrate":
+        if not os.path.exists(args.source):
+            parser.error(f"Zdroj {args.source} neexistuje")
+        source = storage_for_path(args.source)
+        target = storage_for_path(args.target)
+        if target.count() and not args.force:
+            parser.error(f"Cíl {args.target} už obsahuje data (použij --force)")
+        total = migrate(source, target)
+        skipped = len(source.load_all()) - total
+        print(f"✅ Migrováno {total} fanoušků: {args.source} → {args.target}")
+        if skipped:
+            print(f"⚠️ Přeskočeno {skipped} duplicitních nicknamů")
+        source.close()
+        target.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,16 @@
+"""
+Stránky BaddieOS. Každá stránka je vlastní modul s funkcí page_*,
+app.py ho importuje až při prvním otevření – těžké závislosti (pandas,
+requests) se tak načtou jen se stránkou, která je potřebuje.
+"""
+
+TIER_COLORS = {
+    "Free": "#6c757d",
+    "Supporter": "#0d6efd",
+    "VIP": "#ffc107"
+}
+TIER_EMOJI = {
+    "Free": "👤",
+    "Supporter": "⭐",
+    "VIP": "👑"
+}
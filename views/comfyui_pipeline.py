@@ -0,0 +1,337 @@
+"""Stránka 🎬 ComfyUI Pipeline – konfigurátor workflow tančícího psa."""
+
+import io
+import random
+
+import streamlit as st
+
+import perf
+from comfyui_workflow import (
+    MAX_SWEEP_VARIANTS,
+    SWEEP_PARAMS,
+    filename_prefix,
+    generate_comfyui_workflow,
+    get_template,
+    iter_sweep,
+    parse_sweep_values,
+    sweep_size,
+    write_sweep_jsonl,
+    write_sweep_zip,
+)
+
+
+@perf.timed("page.comfyui_pipeline")
+def page_comfyui_pipeline():
+    """Modul pro konfiguraci a export ComfyUI workflow pro tančícího psa."""
+    # Výchozí hodnoty widgetů bere stránka ze stejné šablony, ze které se generuje
+    template = get_template()
+    defaults = template.defaults
+    st.title("🎬 ComfyUI Pipeline – Tančící Pes")
+    st.markdown("Konfigurátor workflow pro generování videa psa tančícího podle lidského vzoru")
+
+    # Přehled pipeline
+    st.markdown("---")
+    st.subheader("🗺️ Pipeline přehled")
+
+    col1, col2, col3, col4, col5 = st.columns(5)
+    with col1:
+        st.markdown("""
+        <div class="metric-card">
+            <h3>1️⃣</h3>
+            <p><strong>DWPose</strong></p>
+            <p>Extrakce pohybu</p>
+        </div>
+        """, unsafe_allow_html=True)
+    with col2:
+        st.markdown("""
+        <div class="metric-card">
+            <h3>2️⃣</h3>
+            <p><strong>IP-Adapter</strong></p>
+            <p>Identita psa</p>
+        </div>
+        """, unsafe_allow_html=True)
+    with col3:
+        st.markdown("""
+        <div class="metric-card">
+            <h3>3️⃣</h3>
+            <p><strong>AnimateDiff</strong></p>
+            <p>Časová konzistence</p>
+        </div>
+        """, unsafe_allow_html=True)
+    with col4:
+        st.markdown("""
+        <div class="metric-card">
+            <h3>4️⃣</h3>
+            <p><strong>Prompt</strong></p>
+            <p>Engineering</p>
+        </div>
+        """, unsafe_allow_html=True)
+    with col5:
+        st.markdown("""
+        <div class="metric-card">
+            <h3>5️⃣</h3>
+            <p><strong>Upscale</strong></p>
+            <p>Post-produkce</p>
+        </div>
+        """, unsafe_allow_html=True)
+
+    st.markdown("---")
+
+    # Krok 1 – DWPose ControlNet
+    with st.expander("1️⃣ Extrakce pohybu – DWPose ControlNet", expanded=True):
+        st.markdown("""
+        **Proč DWPose a ne klasický OpenPose?**
+        DWPose (DWPreprocessor) je výrazně přesnější v detekci rukou a složitých póz – ideální pro taneční pohyby.
+
+        - 📥 **Vstup:** Referenční TikTok video s tancem
+        - ⚙️ **Proces:** DWPose vyextrahuje z tancujícího člověka "stickmana" – kostru pohybu
+        - 🐾 **Trik:** Pes nemá lidská kolena → sniž `strength` na 0.7–0.8, aby AI mohla přizpůsobit psí anatomii
+        """)
+        controlnet_strength = st.slider(
+            "ControlNet Strength",
+            min_value=0.0, max_value=1.0,
+            value=defaults["controlnet_strength"], step=0.05,
+            help="Doporučená hodnota: 0.70–0.80 pro psí anatomii"
+        )
+        st.caption(f"✅ Vybrána síla: **{controlnet_strength}** – {'🐾 Vhodné pro psa' if 0.65 <= controlnet_strength <= 0.85 else '⚠️ Mimo doporučený rozsah'}")
+
+    # Krok 2 – IP-Adapter
+    with st.expander("2️⃣ Zachování identity psa – IP-Adapter Plus", expanded=True):
+        st.markdown("""
+        **Proč IP-Adapter místo LoRA?**
+        IP-Adapter Plus nevyžaduje trénování – stačí jedna čistá fotka psa.
+
+        - 📥 **Vstup:** Fotka psa (ideálně pohled přímo do kamery)
+        - 🎨 **Výsledek:** AI převezme texturu srsti, barvy a tvar obličeje
+        - 💡 **Tip:** Pro velmi specifické psy přidej druhý pass přes IP-Adapter FaceID zaměřený jen na čumák
+        """)
+        ip_adapter_weight = st.slider(
+            "IP-Adapter Weight",
+            min_value=0.0, max_value=1.5,
+            value=defaults["ip_adapter_weight"], step=0.05,
+            help="Vyšší hodnota = silnější vliv fotky psa na výsledek"
+        )
+        st.caption(f"✅ Vybrána váha: **{ip_adapter_weight}**")
+
+    # Krok 3 – AnimateDiff
+    with st.expander("3️⃣ Časová konzistence – AnimateDiff", expanded=True):
+        st.markdown("""
+        **Proč AnimateDiff?**
+        Zabraňuje blikání a "třesu" mezi snímky – pes se během celého tance nebude měnit na jiné plemeno.
+
+        - ✅ Doporučené modely: **V2** nebo **V3** pro nejlepší plynulost
+        - 🎞️ Uzamyká kontext mezi jednotlivými framy
+        """)
+        col1, col2 = st.columns(2)
+        with col1:
+            total_frames = st.number_input(
+                "Počet framů", min_value=8, max_value=128,
+                value=defaults["total_frames"], step=8,
+                help="Doporučeno: 16–32 framů pro plynulou animaci"
+            )
+        with col2:
+            frame_rate = st.number_input(
+                "Frame rate (FPS)", min_value=8, max_value=30,
+                value=defaults["frame_rate"], step=1
+            )
+        st.caption(f"🎬 Délka videa: cca **{total_frames / frame_rate:.1f}s** při {frame_rate} FPS")
+
+    # Krok 4 – Prompt Engineering
+    with st.expander("4️⃣ Prompt Engineering", expanded=True):
+        st.markdown("""
+        **Klíčová slova pro propojení lidské kostry s psím tělem:**
+        - `anthropomorphic` nebo `standing upright` dává AI povolení aplikovat DWPose kostru na zvíře
+        """)
+        breed = st.text_input(
+            "Plemeno psa",
+            value="golden retriever",
+            help="Např. golden retriever, german shepherd, husky..."
+        )
+        positive_prompt = st.text_area(
+            "Pozitivní prompt",
+            value=f"anthropomorphic {breed} dog, standing upright on two hind legs, dancing, human-like posture, highly detailed, realistic lighting, 4k, volumetric light",
+            height=80
+        )
+        negative_prompt = st.text_area(
+            "Negativní prompt",
+            value=defaults["negative_prompt"],
+            height=60
+        )
+
+    # Krok 5 – Post-produkce
+    with st.expander("5️⃣ Post-produkce & Upscale", expanded=True):
+        st.markdown("""
+        **Výstup z AnimateDiff bývá v nižším rozlišení – pro ostré video na sociální sítě ho upscaluj.**
+
+        - 🔲 **Tile ControlNet Upscale** – zachová detaily srsti
+        - 📱 **Výstupní formát:** Vertikální 9:16 pro Reels/TikTok
+        - 🎵 **Tip:** Přilep moderní energický beat a máš hotovo!
+        """)
+        col1, col2 = st.columns(2)
+        widths, heights = [512, 576, 640, 768], [768, 896, 1024]
+        with col1:
+            width = st.selectbox("Šířka (px)", widths, index=widths.index(defaults["width"]))
+        with col2:
+            height = st.selectbox("Výška (px)", heights, index=heights.index(defaults["height"]))
+        st.caption(f"📐 Poměr stran: **{width}×{height}** (~{height/width:.2f}:1)")
+
+    # Pokročilé nastavení
+    with st.expander("⚙️ Pokročilé nastavení sampleru"):
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            steps = st.slider("Kroky sampleru", min_value=10, max_value=50, value=defaults["steps"], step=5)
+        with col2:
+            cfg = st.slider("CFG Scale", min_value=1.0, max_value=15.0, value=defaults["cfg"], step=0.5)
+        with col3:
+            seed = st.number_input("Seed (0 = náhodný)", min_value=0, max_value=2**31 - 1,
+                                   value=0, step=1)
+
+    st.markdown("---")
+
+    # Generování a stažení workflow
+    st.subheader("📦 Export ComfyUI Workflow")
+    st.info("""
+    💡 **Jak použít:**
+    1. Stáhni JSON šablonu nebo zkonfiguruj parametry a vygeneruj vlastní
+    2. Importuj do ComfyUI: **Workflow → Open (nebo drag & drop JSON do okna)**
+    3. Nahraj `input_dance.mp4` a `dog_photo.png` do složky `ComfyUI/input/`
+    4. Klikni **Queue Prompt** – a sekáš obsah jako Baťa cvičky 🎉
+    """)
+
+    # Stáhnout čistou šablonu
+    col_tmpl, col_gen = st.columns(2)
+
+    with col_tmpl:
+        st.markdown("**📄 Čistá šablona (doporučeno pro rychlý start)**")
+        st.download_button(
+            label="⬇️ Stáhnout čistou šablonu (JSON)",
+            data=template.dumps(),
+            file_name="comfyui_dog_dance_template.json",
+            mime="application/json",
+            help="Hotový workflow s výchozími hodnotami – stačí nahrát soubory do ComfyUI/input/ a spustit"
+        )
+        st.caption(
+            f"Golden Retriever · {defaults['width']}×{defaults['height']} · {defaults['total_frames']} framů"
+            " · DWPose + IP-Adapter + AnimateDiff + Upscale"
+        )
+
+    with col_gen:
+        st.markdown("**⚙️ Vlastní nastavení (z konfigurace výše)**")
+        compact = st.checkbox("Kompaktní JSON (bez odsazení)", help="Menší soubor – pro API/render farmu, hůř se čte")
+        if st.button("⚡ Generovat vlastní workflow JSON", type="primary"):
+            effective_seed = seed if seed != 0 else random.randint(1, 2**31 - 1)
+            workflow = generate_comfyui_workflow(
+                breed=breed,
+                positive_prompt=positive_prompt,
+                negative_prompt=negative_prompt,
+                controlnet_strength=controlnet_strength,
+                ip_adapter_weight=ip_adapter_weight,
+                steps=steps,
+                cfg=cfg,
+                seed=effective_seed,
+                width=width,
+                height=height,
+                frame_rate=frame_rate,
+                total_frames=total_frames,
+            )
+            workflow_json = template.dumps(workflow, compact=compact)
+
+            st.success("✅ Workflow vygenerováno!")
+            st.download_button(
+                label="⬇️ Stáhnout vlastní workflow.json",
+                data=workflow_json,
+                file_name=f"dog_dance_{breed.replace(' ', '_')}_workflow.json",
+                mime="application/json"
+            )
+
+            # Náhled JSON
+            with st.expander("🔍 Náhled workflow JSON"):
+                st.code(workflow_json, language="json")
+
+    # Sweep – stejná konfigurace, rozmítnuté osy
+    st.markdown("---")
+    st.subheader("🎛️ Sweep – dávka variant pro render farmu")
+    if st.toggle("Zapnout sweep režim", help="Víc variant workflow najednou – ZIP nebo JSONL ke stažení"):
+        base = dict(
+            positive_prompt=positive_prompt,
+            negative_prompt=negative_prompt,
+            width=width,
+            height=height,
+            frame_rate=frame_rate,
+            total_frames=total_frames,
+            filename_prefix=filename_prefix(breed),
+        )
+        current = dict(
+            seed=seed if seed != 0 else "1:8",
+            controlnet_strength=controlnet_strength,
+            ip_adapter_weight=ip_adapter_weight,
+            steps=steps,
+            cfg=cfg,
+        )
+        sweep_section(base, current)
+
+    st.markdown("---")
+
+    # Přehled potřebných modelů
+    st.subheader("📋 Potřebné modely & rozšíření")
+    st.markdown("""
+    | Komponenta | Soubor | Složka v ComfyUI |
+    |-----------|--------|-----------------|
+    | Base model | `realisticVisionV60B1_v51VAE.safetensors` | `models/checkpoints/` |
+    | DWPose ControlNet | `control_v11p_sd15_openpose_fp16.safetensors` | `models/controlnet/` |
+    | IP-Adapter Plus | `ip-adapter-plus_sd15.bin` | `models/ipadapter/` |
+    | AnimateDiff V2 | `mm_sd_v15_v2.ckpt` | `custom_nodes/ComfyUI-AnimateDiff-Evolved/models/` |
+    | Upscale | `RealESRGAN_x2plus.pth` | `models/upscale_models/` |
+    | **Rozšíření** | ComfyUI-AnimateDiff-Evolved | `custom_nodes/` |
+    | **Rozšíření** | ComfyUI-VideoHelperSuite | `custom_nodes/` |
+    | **Rozšíření** | ComfyUI_IPAdapter_plus | `custom_nodes/` |
+    | **Rozšíření** | comfyui_controlnet_aux | `custom_nodes/` |
+    """)
+
+
+def sweep_section(base: dict, current: dict):
+    """Sweep přes seed, síly, kroky a CFG – varianty se zapisují průběžně do jednoho souboru."""
+    st.markdown("Každá osa bere seznam (`1, 2, 5`) nebo rozsah včetně konce (`0.6:0.9:0.1`, krok výchozí 1). "
+                "Varianty jsou kartézský součin os; ostatní nastavení je z konfigurace výše.")
+
+    axes = {}
+    invalid = []
+    cols = st.columns(len(SWEEP_PARAMS))
+    for col, (name, cast) in zip(cols, SWEEP_PARAMS.items()):
+        with col:
+            text = st.text_input(name, value=str(current[name]), key=f"sweep_{name}")
+        # Osa smí mít jen tolik hodnot, kolik zbývá z limitu po předchozích osách
+        values = parse_sweep_values(text, cast, MAX_SWEEP_VARIANTS // sweep_size(axes))
+        if values is None:
+            invalid.append(name)
+        else:
+            axes[name] = values
+
+    if invalid:
+        st.error(f"Neplatné hodnoty nebo příliš velký rozsah (maximum je {MAX_SWEEP_VARIANTS} variant): "
+                 f"{', '.join(invalid)}")
+        return
+
+    total = sweep_size(axes)
+    st.caption(" × ".join(f"{name} ({len(values)})" for name, values in axes.items()) + f" = **{total} variant**")
+
+    fmt = st.radio("Formát", ["ZIP (soubor na workflow)", "JSONL (řádek na workflow)"], horizontal=True)
+    if st.button("⚡ Generovat sweep", type="primary"):
+        variants = iter_sweep(base, axes)
+        buffer = io.BytesIO()
+        if fmt.startswith("ZIP"):
+            count = write_sweep_zip(variants, buffer)
+            file_name, mime = f"{base['filename_prefix']}_sweep.zip", "application/zip"
+        else:
+            text_buffer = io.TextIOWrapper(buffer, encoding="utf-8", write_through=True)
+            count = write_sweep_jsonl(variants, text_buffer)
+            text_buffer.detach()
+            file_name, mime = f"{base['filename_prefix']}_sweep.jsonl", "application/x-ndjson"
+
+        st.success(f"✅ Vygenerováno {count} variant ({buffer.tell() / 1024:.0f} kB)")
+        st.download_button(
+            label=f"⬇️ Stáhnout {file_name}",
+            data=buffer.getvalue(),
+            file_name=file_name,
+            mime=mime
+        )
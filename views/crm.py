@@ -0,0 +1,150 @@
+"""Stránka 👥 CRM & Třídění 'Vojáčků'."""
+
+from datetime import datetime
+
+import pandas as pd
+import streamlit as st
+
+import perf
+from db import export_csv, get_storage, search_fans
+from frames import get_sorted_df, paginate
+from storage import TIERS
+from views import TIER_COLORS, TIER_EMOJI
+
+
+# Řazení a stránkování CRM seznamu
+SORT_KEYS = {
+    "💰 Podpora": "total_support",
+    "🕐 Vytvořeno": "created",
+    "🔤 Nickname": "nickname",
+}
+PAGE_SIZES = [10, 25, 50, 100]
+
+
+@perf.timed("page.crm")
+def page_crm():
+    """CRM modul pro správu fanoušků."""
+    st.title("👥 CRM & Třídění 'Vojáčků'")
+    st.markdown("Správa tvé fanouškovské základny")
+    
+    # Přidání nového fanouška
+    with st.expander("➕ Přidat nového fanouška", expanded=False):
+        with st.form("add_fan_form"):
+            nickname = st.text_input("Nickname *")
+            tier = st.selectbox("Tier *", TIERS)
+            total_support = st.number_input("Celková podpora (Kč)", min_value=0, value=0)
+            notes = st.text_area("Poznámky")
+            migrate_telegram = st.checkbox("Migrovat na Telegram?")
+            
+            submitted = st.form_submit_button("💾 Přidat")
+            
+            if submitted:
+                if not nickname.strip():
+                    st.error("Nickname je povinný!")
+                else:
+                    new_fan = {
+                        "nickname": nickname.strip(),
+                        "tier": tier,
+                        "total_support": total_support,
+                        "notes": notes.strip(),
+                        "migrate_telegram": migrate_telegram,
+                        "created": datetime.now().isoformat()
+                    }
+                    # Kontrola duplicity a vložení jsou jedna atomická operace
+                    if get_storage().insert_fan(new_fan):
+                        st.success(f"✅ Fanoušek '{nickname}' byl přidán!")
+                        st.rerun()
+                    else:
+                        st.error(f"Fanoušek '{nickname}' už existuje!")
+    
+    # Export databáze
+    with st.expander("📥 Export databáze", expanded=False):
+        st.markdown("Hromadný import/export (CSV, JSONL, Parquet): `python fan_io.py --help`")
+        if st.button("📄 Připravit CSV export"):
+            st.download_button(
+                label="⬇️ Stáhnout fans.csv",
+                data=export_csv(),
+                file_name="fans.csv",
+                mime="text/csv"
+            )
+    
+    st.markdown("---")
+    
+    # Filtry
+    st.subheader("🔍 Filtry")
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        tier_filter = st.multiselect("Filtrovat podle tier", TIERS, default=TIERS)
+    
+    with col2:
+        search = st.text_input("Hledat podle nickname")
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        sort_label = st.selectbox("Řadit podle", list(SORT_KEYS))
+    
+    with col2:
+        descending = st.toggle("Sestupně", value=True)
+    
+    with col3:
+        page_size = st.selectbox("Fanoušků na stránku", PAGE_SIZES, index=1)
+    
+    # Načtení a filtrování dat (seřazený DataFrame je v cache)
+    df = get_sorted_df(SORT_KEYS[sort_label], ascending=not descending)
+    
+    if not df.empty:
+        # Aplikace filtrů (hledání přes index nicknamů – bez diakritiky)
+        df_filtered = df
+        matches = search_fans(search)
+        if matches is not None:
+            df_filtered = df_filtered[df_filtered.index.isin(matches)]
+        df_filtered = df_filtered[df_filtered["tier"].isin(tier_filter)]
+        
+        # Stránkování – widgety se staví jen pro viditelnou stránku
+        total_pages = max(1, -(-len(df_filtered) // page_size))
+        if st.session_state.get("crm_page", 1) > total_pages:
+            st.session_state["crm_page"] = total_pages
+        page = st.number_input(
+            f"Stránka (z {total_pages})", min_value=1, max_value=total_pages, step=1, key="crm_page"
+        )
+        df_page = paginate(df_filtered, page, page_size)
+        
+        st.markdown(f"**Zobrazeno:** {len(df_filtered)} / {len(df)} fanoušků · strana {page}/{total_pages}")
+        
+        # Zobrazení tabulky
+        if not df_page.empty:
+            for idx, row in df_page.iterrows():
+                emoji = TIER_EMOJI[row["tier"]]
+                color = TIER_COLORS[row["tier"]]
+                
+                # VIP řádky zvýrazněné
+                if row["tier"] == "VIP":
+                    st.markdown(f"""
+                    <div class="vip-row">
+                        <strong>{emoji} {row['nickname']}</strong> | 
+                        <em>{row['tier']}</em> | 
+                        <strong>{int(row['total_support'])} Kč</strong>
+                    </div>
+                    """, unsafe_allow_html=True)
+                else:
+                    st.markdown(f"**{emoji} {row['nickname']}** | *{row['tier']}* | **{int(row['total_support'])} Kč**")
+                
+                # Expander pro detail/editaci
+                with st.expander(f"Detail: {row['nickname']}"):
+                    st.markdown(f"**Poznámky:** {row.get('notes', 'Žádné poznámky')}")
+                    st.markdown(f"**Telegram:** {'✅ Ano' if row.get('migrate_telegram') else '❌ Ne'}")
+                    created = row["created"]
+                    created_str = f"{created:%d.%m.%Y %H:%M}" if pd.notna(created) else "N/A"
+                    st.markdown(f"**Vytvořeno:** {created_str}")
+                    
+                    # Tlačítko pro smazání
+                    if st.button(f"🗑️ Smazat {row['nickname']}", key=f"delete_{idx}"):
+                        get_storage().delete_fan(row["nickname"])
+                        st.success(f"✅ Fanoušek '{row['nickname']}' byl smazán!")
+                        st.rerun()
+        else:
+            st.info("Žádní fanoušci neodpovídají filtrům.")
+    else:
+        st.info("Zatím žádní fanoušci v databázi. Přidej prvního pomocí formuláře výše!")
@@ -0,0 +1,72 @@
+"""Stránka 📊 Dashboard – přehled metrik fanouškovské základny."""
+
+import streamlit as st
+
+import perf
+from db import get_stats
+from views import TIER_EMOJI
+
+
+@perf.timed("page.dashboard")
+def page_dashboard():
+    """Hlavní dashboard s přehledem metrik."""
+    st.title("📊 Dashboard")
+    st.markdown("Přehled tvé fanouškovské základny")
+    
+    stats = get_stats()
+    
+    # Metriky
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        total_fans = stats["total"]
+        st.markdown(f"""
+        <div class="metric-card">
+            <h3>👥 Celkem fanoušků</h3>
+            <h1>{total_fans}</h1>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col2:
+        vip_count = stats["tier_counts"].get("VIP", 0)
+        st.markdown(f"""
+        <div class="metric-card">
+            <h3>👑 VIP</h3>
+            <h1>{vip_count}</h1>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col3:
+        supporter_count = stats["tier_counts"].get("Supporter", 0)
+        st.markdown(f"""
+        <div class="metric-card">
+            <h3>⭐ Supporters</h3>
+            <h1>{supporter_count}</h1>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col4:
+        total_support = stats["total_support"]
+        st.markdown(f"""
+        <div class="metric-card">
+            <h3>💰 Celková podpora</h3>
+            <h1>{int(total_support)} Kč</h1>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    st.markdown("---")
+    
+    # Top 5 fanoušků
+    st.subheader("🏆 Top 5 Fanoušků")
+    if stats["top"]:
+        for fan in stats["top"]:
+            emoji = TIER_EMOJI[fan["tier"]]
+            col1, col2, col3 = st.columns([3, 2, 2])
+            with col1:
+                st.markdown(f"{emoji} **{fan['nickname']}**")
+            with col2:
+                st.markdown(f"*{fan['tier']}*")
+            with col3:
+                st.markdown(f"**{int(fan['total_support'])} Kč**")
+    else:
+        st.info("Zatím žádní fanoušci v databázi.")
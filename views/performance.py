@@ -0,0 +1,109 @@
+"""Stránka ⏱ Performance – časy rerunů a horkých cest (perf.py)."""
+
+import json
+from datetime import datetime
+
+import pandas as pd
+import streamlit as st
+
+import perf
+
+
+@perf.timed("page.performance")
+def page_performance():
+    """Časy rerunů a horkých cest naměřené modulem perf."""
+    st.title("⏱ Performance")
+    st.markdown(
+        f"Kde rerun tráví čas – posledních {perf.MAX_TRACES} rerunů, "
+        f"u každého úseku posledních {perf.MAX_SAMPLES} měření"
+    )
+    
+    col1, col2 = st.columns([3, 1])
+    with col1:
+        enabled = st.toggle(
+            "Měření zapnuto",
+            value=perf.enabled(),
+            help="Platí pro celý proces. Výchozí stav nastavuje BADDIEOS_PERF (1/0).",
+        )
+        if enabled != perf.enabled():
+            perf.set_enabled(enabled)
+    with col2:
+        if st.button("🧹 Vymazat data"):
+            perf.RECORDER.reset()
+            st.rerun()
+    
+    traces = perf.RECORDER.recent_traces()
+    if not traces:
+        st.info("Zatím žádná data – proklikej pár stránek a vrať se sem.")
+        return
+    
+    durations = sorted(trace.duration * 1000 for trace in traces)
+    col1, col2, col3 = st.columns(3)
+    col1.metric("Poslední rerun", f"{traces[-1].duration * 1000:.1f} ms")
+    col2.metric("Medián rerunu", f"{durations[len(durations) // 2]:.1f} ms")
+    col3.metric("Rerunů", len(traces))
+    
+    st.markdown("---")
+    
+    # Délka posledních rerunů podle stránky
+    st.subheader("📈 Poslední reruny")
+    reruns = pd.DataFrame({
+        "rerun": range(1, len(traces) + 1),
+        "stránka": [trace.name for trace in traces],
+        "ms": [trace.duration * 1000 for trace in traces],
+    })
+    st.bar_chart(reruns, x="rerun", y="ms", color="stránka")
+    
+    # Souhrn úseků – kde se zpomalilo, ukáže "poslední" proti p50
+    st.subheader("🧩 Úseky")
+    st.dataframe(
+        pd.DataFrame(perf.RECORDER.summary()).round(2),
+        hide_index=True,
+        use_container_width=True,
+    )
+    
+    # Histogram vybraného úseku
+    names = perf.RECORDER.names()
+    name = st.selectbox("Histogram úseku", names, index=names.index("rerun") if "rerun" in names else 0)
+    histogram = pd.DataFrame(perf.RECORDER.histogram(name), columns=["čas", "počet"])
+    st.dataframe(
+        histogram[histogram["počet"] > 0],
+        hide_index=True,
+        use_container_width=True,
+        column_config={
+            "počet": st.column_config.ProgressColumn(
+                "počet", format="%d", min_value=0, max_value=int(histogram["počet"].max())
+            ),
+        },
+    )
+    
+    # Rozpad jednoho rerunu
+    st.subheader("🔬 Detail rerunu")
+    labels = [
+        f"#{i} {trace.name} – {trace.duration * 1000:.1f} ms"
+        for i, trace in enumerate(traces, 1)
+    ]
+    choice = st.selectbox("Rerun", range(len(traces)), index=len(traces) - 1, format_func=labels.__getitem__)
+    trace = traces[choice]
+    spans = pd.DataFrame(
+        [
+            {
+                "úsek": name,
+                "začátek ms": (start - trace.start) * 1000,
+                "trvání ms": duration * 1000,
+                "vlákno": thread,
+            }
+            for name, start, duration, thread in sorted(trace.spans, key=lambda s: s[1])
+        ],
+        columns=["úsek", "začátek ms", "trvání ms", "vlákno"],
+    )
+    st.dataframe(spans.round(2), hide_index=True, use_container_width=True)
+    
+    # Export pro chrome://tracing / Perfetto
+    st.download_button(
+        label="⬇️ Stáhnout trace (Chrome/Perfetto JSON)",
+        data=json.dumps(perf.RECORDER.chrome_trace()),
+        file_name=f"baddieos_trace_{datetime.now():%Y%m%d_%H%M%S}.json",
+        mime="application/json",
+    )
+    st.caption("Otevři v https://ui.perfetto.dev nebo chrome://tracing – vnořené úseky jsou vidět na časové ose.")
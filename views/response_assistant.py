@@ -0,0 +1,149 @@
+"""Stránka 💬 Response Assistant – odpovědi na zprávy a třídění inboxu."""
+
+import streamlit as st
+
+import perf
+from llm import llm_settings, source_caption
+from responses import generate_response, stream_response
+from templates import RESPONSE_TEMPLATES
+
+
+@perf.timed("page.response_assistant")
+def page_response_assistant():
+    """Modul pro generování odpovědí na zprávy."""
+    st.title("💬 'Inteligentní Provokatérka'")
+    st.markdown("AI asistent pro odpovídání na zprávy fanoušků")
+    
+    # Nastavení persony
+    with st.expander("⚙️ Nastavení Persony", expanded=False):
+        persona_name = st.text_input("Jméno persony", value="BaddieBabe")
+        persona_lore = st.text_area(
+            "Persona Lore (background příběh)",
+            value="Jsem sebevědomá, trochu drzá, ale vtipná digitální influencerka. Miluji zábavu a komunikaci s fanoušky.",
+            height=100
+        )
+        use_llm, budget = llm_settings("response")
+        stream_llm = st.toggle(
+            "⚡ Zobrazovat odpověď průběžně",
+            value=True,
+            disabled=not use_llm,
+            help="Text z Ollamy se vypisuje, jak vzniká (mimo cache odpovědí)"
+        )
+    
+    st.markdown("---")
+    
+    tab_single, tab_batch = st.tabs(["✉️ Jedna zpráva", "📥 Dávkový režim (inbox)"])
+    
+    with tab_single:
+        # Input zprávy
+        st.subheader("📩 Zpráva od fanouška")
+        user_message = st.text_area("Napiš zprávu od fanouška:", height=100, key="user_msg")
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            generate_btn = st.button("🎲 Generovat odpověď", type="primary")
+        with col2:
+            regenerate_btn = st.button("🔄 Jiná varianta")
+        
+        # Generování odpovědi
+        if (generate_btn or regenerate_btn) and user_message.strip():
+            st.markdown("---")
+            st.subheader("💬 Vygenerovaná odpověď")
+            meta = st.container()
+            card = st.empty()
+            
+            if use_llm and stream_llm:
+                result = stream_response(
+                    user_message,
+                    lambda text: card.markdown(status_card(text + " ▌"), unsafe_allow_html=True),
+                    persona_name,
+                    persona_lore,
+                    budget=budget
+                )
+            else:
+                result = generate_response(
+                    user_message,
+                    persona_name,
+                    persona_lore,
+                    use_llm=use_llm,
+                    fresh=regenerate_btn,
+                    budget=budget
+                )
+            category, response = result["category"], result["response"]
+            
+            with meta:
+                st.markdown(f"**Kategorie:** `{category.upper()}`")
+                st.caption(source_caption(result))
+            card.markdown(status_card(response), unsafe_allow_html=True)
+            
+            # Kopírovací pole
+            st.code(response, language=None)
+        
+        elif (generate_btn or regenerate_btn):
+            st.warning("⚠️ Napiš nejprve zprávu od fanouška!")
+    
+    with tab_batch:
+        inbox_triage_section()
+    
+    # Přehled šablon
+    with st.expander("📚 Přehled šablon odpovědí"):
+        for category, templates in RESPONSE_TEMPLATES.items():
+            st.markdown(f"**{category.upper()}**")
+            for template in templates:
+                st.markdown(f"- {template}")
+            st.markdown("")
+
+
+def status_card(text: str) -> str:
+    """HTML karta s odpovědí."""
+    return f"""
+            <div class="status-card">
+                {text}
+            </div>
+            """
+
+
+def inbox_triage_section():
+    """Dávkové třídění celého inboxu – klasifikace a drafty odpovědí najednou."""
+    st.subheader("📥 Dávkové třídění inboxu")
+    st.markdown("Vlož zprávy (jedna na řádek) nebo nahraj export inboxu – CSV nebo JSONL se sloupcem `message`/`text`.")
+    
+    inbox_text = st.text_area("Zprávy (jedna na řádek):", height=150, key="inbox_text")
+    inbox_file = st.file_uploader("…nebo nahraj export inboxu", type=["csv", "jsonl", "ndjson"])
+    
+    if st.button("⚡ Roztřídit inbox", type="primary"):
+        # pandas se načte až při prvním třídění, ne s otevřením stránky
+        from inbox_triage import READ_ERRORS, load_inbox_file, parse_inbox_text, triage_inbox
+        try:
+            inbox = load_inbox_file(inbox_file) if inbox_file else parse_inbox_text(inbox_text)
+        except READ_ERRORS as e:
+            st.error(f"Soubor se nepodařilo načíst: {e}")
+            inbox = None
+        if inbox is not None and inbox.empty:
+            st.warning("⚠️ Inbox neobsahuje žádné zprávy!")
+        elif inbox is not None:
+            st.session_state["inbox_results"] = triage_inbox(inbox)
+    
+    if "inbox_results" in st.session_state:
+        results = st.session_state["inbox_results"]
+        counts = results["category"].value_counts()
+        
+        st.markdown("---")
+        st.markdown(f"**Roztříděno:** {len(results)} zpráv")
+        col1, col2 = st.columns([1, 2])
+        with col1:
+            st.dataframe(
+                counts.rename_axis("Kategorie").reset_index(name="Počet"),
+                hide_index=True,
+                use_container_width=True
+            )
+        with col2:
+            st.bar_chart(counts)
+        
+        st.dataframe(results, hide_index=True, use_container_width=True)
+        st.download_button(
+            label="⬇️ Stáhnout výsledky (CSV)",
+            data=results.to_csv(index=False).encode("utf-8"),
+            file_name="inbox_triage.csv",
+            mime="text/csv"
+        )
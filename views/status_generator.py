@@ -0,0 +1,77 @@
+"""Stránka 📡 Status Generator."""
+
+from datetime import datetime
+
+import streamlit as st
+
+import perf
+from llm import get_ollama, llm_settings, source_caption
+from statuses import generate_status, generate_statuses, get_auto_period, get_status_pool
+
+
+@perf.timed("page.status_generator")
+def page_status_generator():
+    """Modul pro generování statusů."""
+    st.title("📡 'Teď a Tady' – Status Generator")
+    st.markdown("Automatické generování statusů pro sociální sítě")
+    
+    # Info o aktuálním období
+    current_period = get_auto_period()
+    hour = datetime.now().hour
+    st.info(f"🕐 Aktuální čas: {hour}:00 → Detekované období: **{current_period.upper()}**")
+    
+    st.markdown("---")
+    
+    # Výběr období
+    st.subheader("⚙️ Nastavení")
+    period = st.selectbox(
+        "Vyber období",
+        ["auto", "ráno", "odpoledne", "večer", "náhodný"],
+        index=0
+    )
+    use_llm, budget = llm_settings("status")
+    if use_llm and get_ollama().is_available():
+        # Zásobník se začne plnit hned při otevření stránky
+        pool_period = current_period if period == "auto" else period
+        pool = get_status_pool(True)
+        pool.warm(pool_period)
+        st.caption(f"🧺 V zásobníku: {pool.ready_count(pool_period)} hotových AI statusů")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        if st.button("🎲 Generovat 1 status", type="primary"):
+            status = generate_status(period, use_llm, budget)
+            st.session_state["single_status"] = status
+    
+    with col2:
+        if st.button("🔄 Generovat 5 statusů"):
+            statuses = generate_statuses(period, 5, use_llm, budget)
+            st.session_state["batch_statuses"] = statuses
+    
+    # Zobrazení jednotlivého statusu
+    if "single_status" in st.session_state:
+        st.markdown("---")
+        st.subheader("💬 Vygenerovaný status")
+        status = st.session_state["single_status"]
+        st.markdown(f"""
+        <div class="status-card">
+            {status['text']}
+        </div>
+        """, unsafe_allow_html=True)
+        st.caption(source_caption(status))
+        st.code(status["text"], language=None)
+    
+    # Zobrazení dávky statusů
+    if "batch_statuses" in st.session_state:
+        st.markdown("---")
+        st.subheader("📝 Dávka statusů")
+        for i, status in enumerate(st.session_state["batch_statuses"], 1):
+            st.markdown(f"**Status {i}:**")
+            st.markdown(f"""
+            <div class="status-card">
+                {status['text']}
+            </div>
+            """, unsafe_allow_html=True)
+            st.caption(source_caption(status))
+            st.code(status["text"], language=None)